@@ -4,6 +4,7 @@ import shutil
 import json
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 import subprocess
 from datetime import datetime
@@ -20,10 +21,23 @@ try:
 except ImportError:
     WAKEPY_AVAILABLE = False
 
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for handler imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from handlers import HandlerRegistry
 
+# On-disk cache of video probe results, keyed by path + size + mtime
+PROBE_CACHE_FILE = Path.home() / ".cache" / "gai_report" / "probe_cache.json"
+
 """
 file download command example:
 yt-dlp -f "bv*[vcodec~='^(h264|avc)']+ba[acodec~='^(mp?4a|aac)']" "https://youtube.com/playlist?list=PLSgBrV2b0XA_ofBZ4c3e85sTNBh3BKN2y&si=_5VpzvdI7hsF-a4o"
@@ -71,6 +85,18 @@ class UnifiedAPIProcessor:
         self.client = None
         self.config = {}
         self.api_definitions = {}
+        self._file_sizes = {}  # path -> st_size recorded while scanning folders
+        self._probe_cache = self._load_probe_cache()
+        self._probe_cache_dirty = False
+        self._download_pool = None  # Created on first background download
+        self._pending_downloads = []
+
+        # Shared HTTP session so downloads reuse keep-alive connections;
+        # retries stay with the handlers' own attempt loops
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
 
         # Setup logging
         logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -86,13 +112,12 @@ class UnifiedAPIProcessor:
         api_def_path = script_dir / "api_definitions.json"
         
         try:
-            with open(api_def_path, 'r', encoding='utf-8') as f:
-                all_definitions = json.load(f)
-                self.api_definitions = all_definitions.get(self.api_name, {})
-                if not self.api_definitions:
-                    self.logger.warning(f"⚠️ No API definition found for '{self.api_name}'")
-                else:
-                    self.logger.info(f"✓ API definitions loaded for {self.api_name}")
+            all_definitions = self._read_json(api_def_path)
+            self.api_definitions = all_definitions.get(self.api_name, {})
+            if not self.api_definitions:
+                self.logger.warning(f"⚠️ No API definition found for '{self.api_name}'")
+            else:
+                self.logger.info(f"✓ API definitions loaded for {self.api_name}")
         except FileNotFoundError:
             self.logger.error(f"❌ API definitions file not found at: {api_def_path}")
             raise
@@ -105,15 +130,15 @@ class UnifiedAPIProcessor:
         config_path = Path(self.config_file)
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                # Detect format by extension
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
+            # Detect format by extension
+            if config_path.suffix.lower() in ['.yaml', '.yml']:
+                with open(config_path, 'r', encoding='utf-8') as f:
                     self.config = yaml.safe_load(f)
-                    self.logger.info(f"✓ Configuration loaded from {self.config_file} (YAML)")
-                else:
-                    self.config = json.load(f)
-                    self.logger.info(f"✓ Configuration loaded from {self.config_file} (JSON)")
-                return True
+                self.logger.info(f"✓ Configuration loaded from {self.config_file} (YAML)")
+            else:
+                self.config = self._read_json(config_path)
+                self.logger.info(f"✓ Configuration loaded from {self.config_file} (JSON)")
+            return True
         except FileNotFoundError:
             self.logger.error(f"❌ Config file not found: {self.config_file}")
             return False
@@ -121,7 +146,74 @@ class UnifiedAPIProcessor:
             self.logger.error(f"❌ Config parse error: {e}")
             return False
 
+    def _load_probe_cache(self):
+        """Load cached video probe results from disk (empty if missing or corrupt)"""
+        try:
+            cache = self._read_json(PROBE_CACHE_FILE)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):  # ValueError: bad JSON or bad UTF-8, stdlib or orjson
+            return {}
+
+    def _save_probe_cache(self):
+        """Persist video probe results if any new entries were added"""
+        if not self._probe_cache_dirty:
+            return
+        try:
+            # Merge with what other processes (parallel runall platforms) saved
+            # meanwhile, then swap the file in atomically
+            cache = {**self._load_probe_cache(), **self._probe_cache}
+            PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = PROBE_CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps(cache), encoding='utf-8')
+            os.replace(tmp, PROBE_CACHE_FILE)
+            self._probe_cache_dirty = False
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not save probe cache: {e}")
+
     def _get_video_info(self, video_path):
+        """Get video information, cached on path + size + mtime across runs"""
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(video_path)}:{st.st_size}:{st.st_mtime_ns}"
+        cached = self._probe_cache.get(key)
+        if cached and isinstance(cached, dict):
+            return dict(cached)
+
+        info = None
+        if av is not None:
+            info = self._get_video_info_av(video_path)
+        if not info:
+            info = self._get_video_info_ffprobe(video_path)
+        if info:
+            self._probe_cache[key] = info
+            self._probe_cache_dirty = True
+        return info
+
+    def _get_video_info_av(self, video_path):
+        """Read video dimensions and duration in-process via PyAV (no ffprobe fork)"""
+        try:
+            with av.open(str(video_path)) as container:
+                if not container.streams.video:
+                    return None
+                stream = container.streams.video[0]
+                if container.duration is not None:
+                    duration = container.duration / av.time_base
+                elif stream.duration is not None and stream.time_base:
+                    duration = float(stream.duration * stream.time_base)
+                else:
+                    duration = 0.0
+                return {
+                    'width': int(stream.codec_context.width or 0),
+                    'height': int(stream.codec_context.height or 0),
+                    'duration': float(duration),
+                    'size_mb': self._file_size_mb(video_path)
+                }
+        except Exception:
+            return None
+
+    def _get_video_info_ffprobe(self, video_path):
         """Get video information using ffprobe (from runway processor)"""
         try:
             result = subprocess.run([
@@ -184,6 +276,34 @@ class UnifiedAPIProcessor:
             self.logger.warning(f" ⚠️ Could not convert {image_path.name}: {e}")
             return image_path
 
+    def _iter_by_ext(self, folder, exts):
+        """
+        Yield directory entries in a folder whose extension is in exts.
+        
+        Uses a single os.scandir pass and records each entry's size so that
+        validate_file does not need another stat call for the same file.
+        
+        Args:
+            folder: Path object or string path to the folder
+            exts: Iterable of lowercase extensions including the dot
+        
+        Yields:
+            os.DirEntry objects for matching files
+        """
+        exts = frozenset(exts)
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in exts:
+                    self._file_sizes[entry.path] = entry.stat().st_size
+                    yield entry
+
+    def _file_size_mb(self, file_path):
+        """Return file size in MB, reusing the size recorded during scanning"""
+        size = self._file_sizes.get(str(file_path))
+        if size is None:
+            size = os.path.getsize(file_path)
+        return size / (1024 * 1024)
+
     def _get_files_by_type(self, folder, file_type='image'):
         """
         Helper method to extract files of a specific type from a folder.
@@ -217,7 +337,7 @@ class UnifiedAPIProcessor:
         
         if file_type in ['image', 'reference_image']:
             # Get all image files
-            files = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in all_image_exts]
+            files = [Path(e.path) for e in self._iter_by_ext(folder, all_image_exts)]
             
             # Convert unsupported formats to JPG
             converted_files = []
@@ -228,7 +348,7 @@ class UnifiedAPIProcessor:
             files = converted_files
         else:
             # Video files - no conversion needed
-            files = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in file_types]
+            files = [Path(e.path) for e in self._iter_by_ext(folder, file_types)]
         
         # Sort files by name for deterministic ordering across runs
         return sorted(files, key=lambda x: x.name.lower())
@@ -240,7 +360,7 @@ class UnifiedAPIProcessor:
 
             if file_type == 'video':
                 # Enhanced video validation for Runway
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                file_size_mb = self._file_size_mb(file_path)
                 video_rules = validation_rules.get('video', {})
 
                 if file_size_mb > video_rules.get('max_size_mb', 500):
@@ -266,7 +386,7 @@ class UnifiedAPIProcessor:
                 # Enhanced image validation
                 if self.api_name == "kling":
                     # Kling specific validation (matching working processor)
-                    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                    file_size_mb = self._file_size_mb(file_path)
                     if file_size_mb >= validation_rules.get('max_size_mb', 32):  # 32MB limit
                         return False, "Size > 32MB"
 
@@ -283,7 +403,7 @@ class UnifiedAPIProcessor:
 
                 elif self.api_name == "runway":
                     # Runway reference image validation
-                    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                    file_size_mb = self._file_size_mb(file_path)
                     if file_size_mb >= validation_rules.get('max_size_mb', 32):
                         return False, "Reference image > 32MB"
 
@@ -295,7 +415,7 @@ class UnifiedAPIProcessor:
 
                 elif self.api_name == "nano_banana":
                     # Nano banana specific validation (matching working processor)
-                    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                    file_size_mb = self._file_size_mb(file_path)
                     if file_size_mb >= validation_rules.get('max_size_mb', 32):
                         return False, "Size > 32MB"
 
@@ -307,12 +427,7 @@ class UnifiedAPIProcessor:
 
                 else:
                     # Standard image validation for vidu APIs
-                    fast_validation = self.api_definitions.get('fast_validation', False)
-
-                    if fast_validation and isinstance(file_path, Path):
-                        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-                    else:
-                        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                    file_size_mb = self._file_size_mb(file_path)
 
                     max_size = validation_rules.get('max_size_mb', 50)
                     if file_size_mb >= max_size:
@@ -336,6 +451,25 @@ class UnifiedAPIProcessor:
         except Exception as e:
             return False, f"Error: {str(e)}"
 
+    def _validate_videos_parallel(self, video_files):
+        """
+        Validate videos concurrently.
+        
+        Each validation is dominated by an ffprobe subprocess, which releases
+        the GIL while waiting, so threads scale with the number of videos.
+        
+        Args:
+            video_files: List of Path objects to validate
+        
+        Returns:
+            List of (is_valid, reason) tuples in the same order as video_files
+        """
+        if len(video_files) < 2:
+            return [self.validate_file(f, 'video') for f in video_files]
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(video_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda f: self.validate_file(f, 'video'), video_files))
+
     def _validate_task_folder_structure(self, task, invalid_list):
         """Base validation template for task-folder structure (kling, nano, genvideo)."""
         folder = Path(task['folder'])
@@ -610,8 +744,7 @@ class UnifiedAPIProcessor:
             
             # Validate videos
             valid_count = 0
-            for video_file in video_files:
-                is_valid, reason = self.validate_file(video_file, 'video')
+            for video_file, (is_valid, reason) in zip(video_files, self._validate_videos_parallel(video_files)):
                 if not is_valid:
                     invalid_videos.append({
                         'path': str(video_file),
@@ -699,8 +832,7 @@ class UnifiedAPIProcessor:
             
             # Validate videos
             valid_video_count = 0
-            for video_file in video_files:
-                is_valid, reason = self.validate_file(video_file, 'video')
+            for video_file, (is_valid, reason) in zip(video_files, self._validate_videos_parallel(video_files)):
                 if not is_valid:
                     invalid_videos.append({
                         'path': str(video_file),
@@ -1087,11 +1219,12 @@ class UnifiedAPIProcessor:
         file_types = self.api_definitions['file_types']
         max_refs = self.api_definitions.get('max_references', 6)
 
+        candidates = [Path(e.path) for e in self._iter_by_ext(ref_dir, file_types)]
+
         # Smart naming convention detection
         for i in range(2, max_refs + 2):
-            files = [f for f in ref_dir.iterdir()
-                    if f.suffix.lower() in file_types and
-                    (f.stem.lower().startswith(f'image{i}') or
+            files = [f for f in candidates
+                    if (f.stem.lower().startswith(f'image{i}') or
                      f.stem.lower().startswith(f'image {i}') or
                      f.stem.split('_')[0] == str(i) or
                      f.stem.split('.')[0] == str(i))]
@@ -1102,8 +1235,7 @@ class UnifiedAPIProcessor:
                 break
 
         # Fallback to sorted files if no naming convention found
-        return refs or sorted([f for f in ref_dir.iterdir()
-                             if f.suffix.lower() in file_types])[:max_refs]
+        return refs or sorted(candidates)[:max_refs]
 
     def closest_aspect_ratio(self, w, h):
         """Enhanced aspect ratio detection from reference_processor"""
@@ -1322,6 +1454,20 @@ class UnifiedAPIProcessor:
             except (TypeError, ValueError):
                 return str(obj)
 
+    def _write_json(self, path, data):
+        """Write metadata JSON (indent=2, UTF-8), encoding with orjson when installed"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _read_json(self, path):
+        """Read a JSON file in one read and parse the raw bytes, with orjson when installed"""
+        data = Path(path).read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
     def save_failure_metadata(self, file_path, task_config, metadata_folder, error, attempts):
         """Enhanced failure metadata saving"""
         base_name = Path(file_path).stem
@@ -1348,8 +1494,7 @@ class UnifiedAPIProcessor:
         # Convert non-serializable objects to strings
         metadata = self._make_json_serializable(metadata)
         metadata_file = Path(metadata_folder) / f"{base_name}_metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        self._write_json(metadata_file, metadata)
 
     def save_metadata(self, metadata_folder, base_name, source_name, result_data, task_config, 
                      api_specific_filename=None, log_status=False):
@@ -1400,8 +1545,7 @@ class UnifiedAPIProcessor:
             metadata_file = metadata_folder / f"{base_name}_metadata.json"
         
         # Write metadata
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self._write_json(metadata_file, metadata)
         
         # Optional status logging
         if log_status:
@@ -1458,19 +1602,16 @@ class UnifiedAPIProcessor:
         Returns:
             bool: True if file has successful metadata, False otherwise.
         """
-        import json
         base_name = Path(file_path).stem
         metadata_file = Path(metadata_folder) / f"{base_name}_metadata.json"
         
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                # Only skip if previous processing was successful
-                return metadata.get('success', False)
-            except (json.JSONDecodeError, IOError):
-                return False
-        return False
+        # A missing file raises OSError, so no separate exists() stat
+        try:
+            metadata = self._read_json(metadata_file)
+            # Only skip if previous processing was successful
+            return metadata.get('success', False)
+        except (ValueError, OSError):
+            return False
 
     def process_task(self, task, task_num, total_tasks):
         """Process task using registered handler."""
@@ -1563,16 +1704,58 @@ class UnifiedAPIProcessor:
     def download_file(self, url, path):
         """Standard file download method"""
         try:
-            with requests.get(url, stream=True, timeout=30) as r:
+            with self.http.get(url, stream=True, timeout=30) as r:
                 r.raise_for_status()
+                total = int(r.headers.get('content-length') or 0)
                 with open(path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=16384):
+                    # Reserve the full size up front where supported (Linux)
+                    if total and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, total)
+                        except OSError:
+                            pass
+                    for chunk in r.iter_content(chunk_size=1 << 20):
                         f.write(chunk)
+                    f.truncate()  # Drop any preallocated tail past the written data
             return True
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
             return False
 
+    def submit_download(self, fn, *args):
+        """
+        Run a download job on the background pool so API calls can continue.
+        
+        Args:
+            fn: Callable performing the download; should return True on success
+            *args: Arguments passed to fn
+        
+        Returns:
+            Future for the submitted job
+        """
+        if self._download_pool is None:
+            self._download_pool = ThreadPoolExecutor(max_workers=4)
+        future = self._download_pool.submit(fn, *args)
+        self._pending_downloads.append(future)
+        return future
+
+    def wait_for_downloads(self):
+        """
+        Block until all background downloads finish.
+        
+        Returns:
+            List of job results (False for jobs that raised)
+        """
+        results = []
+        for future in self._pending_downloads:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.error(f"Download failed: {e}")
+                results.append(False)
+        self._pending_downloads = []
+        return results
+
     def run(self):
         """
         Main execution flow for API processing.
@@ -1585,15 +1768,18 @@ class UnifiedAPIProcessor:
         """
         self.logger.info(f"🚀 Starting {self.api_name.replace('_', ' ').title()} Processor")
         
-        # Use wakepy context manager to prevent sleep during processing
-        if WAKEPY_AVAILABLE:
-            self.logger.info("☕ System sleep prevention activated (wakepy)")
-            with keep.running(on_fail='warn'):
+        try:
+            # Use wakepy context manager to prevent sleep during processing
+            if WAKEPY_AVAILABLE:
+                self.logger.info("☕ System sleep prevention activated (wakepy)")
+                with keep.running(on_fail='warn'):
+                    return self._execute_processing()
+            else:
+                self.logger.warning("⚠️ wakepy not installed - system may sleep during processing")
+                self.logger.warning("   Install with: pip install wakepy")
                 return self._execute_processing()
-        else:
-            self.logger.warning("⚠️ wakepy not installed - system may sleep during processing")
-            self.logger.warning("   Install with: pip install wakepy")
-            return self._execute_processing()
+        finally:
+            self._save_probe_cache()
     
     def _execute_processing(self):
         """
@@ -1633,6 +1819,9 @@ class UnifiedAPIProcessor:
             except Exception as e:
                 self.logger.error(f"Task {i} failed: {e}")
 
+        # Let any background downloads from a failed task finish before returning
+        self.wait_for_downloads()
+
         elapsed = time.time() - start_time
         self.logger.info(f"🎉 Completed {len(valid_tasks)} tasks in {elapsed/60:.1f} minutes")
         
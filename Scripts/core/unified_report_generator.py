@@ -1,20 +1,35 @@
-import json, yaml, logging, sys, re, tempfile, os
+import io, json, yaml, logging, sys, re, tempfile, os, shutil, zipfile, multiprocessing, hashlib, threading
+from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Union
 from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from types import SimpleNamespace
 from PIL import Image
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.util import Cm, Inches, Pt
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import PackageWriter
 
 try:
     import cv2
 except ImportError:
     cv2 = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 try:
     from tqdm import tqdm
     HAS_TQDM = True
@@ -44,7 +59,203 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _load_json_file(path):
+    """Parse a JSON file from raw bytes, using orjson when it is installed"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _open_capture(path):
+    """Open a VideoCapture with a single decoder thread.
+    
+    Captures are opened from a thread pool and only read one frame, so FFmpeg's
+    own per-capture decoder threads just oversubscribe the CPU (and frame
+    threading delays the first decoded frame).
+    """
+    if hasattr(cv2, 'CAP_PROP_N_THREADS'):
+        return cv2.VideoCapture(str(path), cv2.CAP_ANY, [cv2.CAP_PROP_N_THREADS, 1])
+    return cv2.VideoCapture(str(path))
+
+def _index_package_parts(ppt):
+    """Keep python-pptx image/media part lookups O(1) while a deck is built.
+    
+    For every picture, poster frame and movie python-pptx walks all package
+    relationships twice: once to find an existing part with the same SHA1 and
+    once to pick the next free /ppt/media partname, which makes a report
+    O(N^2) in its slide count. Index both once for this package and keep the
+    indexes current as parts are added.
+    """
+    package = ppt.part.package
+    
+    def index_by_sha1(parts_coll, add_method):
+        by_sha1 = {p.sha1: p for p in parts_coll if hasattr(p, 'sha1')}
+        add = getattr(parts_coll, add_method)
+        
+        def get_or_add(media_file):
+            part = add(media_file)
+            by_sha1.setdefault(part.sha1, part)
+            return part
+        
+        parts_coll._find_by_sha1 = by_sha1.get
+        setattr(parts_coll, add_method, get_or_add)
+    
+    index_by_sha1(package._image_parts, 'get_or_add_image_part')
+    index_by_sha1(package._media_parts, 'get_or_add_media_part')
+    
+    # Pictures added by path (a reference image reused across slides) resolve to
+    # their part directly instead of re-reading and re-hashing the file each time
+    by_path = {}
+    add_image = package._image_parts.get_or_add_image_part
+    
+    def get_or_add_image_part(image_file):
+        if not isinstance(image_file, str):
+            return add_image(image_file)
+        part = by_path.get(image_file)
+        if part is None:
+            part = by_path[image_file] = add_image(image_file)
+        return part
+    
+    package._image_parts.get_or_add_image_part = get_or_add_image_part
+    
+    # First free index per partname prefix, same numbering as python-pptx.
+    # Indexes are only ever added, so the search resumes where it left off.
+    taken = {prefix: {p.partname.idx for p in package.iter_parts() if p.partname.startswith(prefix)}
+             for prefix in ('/ppt/media/image', '/ppt/media/media')}
+    next_free = dict.fromkeys(taken, 1)
+    
+    def next_partname(prefix, ext):
+        used, idx = taken[prefix], next_free[prefix]
+        while idx in used:
+            idx += 1
+        used.add(idx)
+        next_free[prefix] = idx + 1
+        return PackURI(f"{prefix}{idx}.{ext}")
+    
+    package.next_image_partname = lambda ext: next_partname('/ppt/media/image', ext)
+    package.next_media_partname = lambda ext: next_partname('/ppt/media/media', ext)
+
+class _StoredPackageWriter(PackageWriter):
+    """PackageWriter that stores zip members uncompressed (report config compression: stored)
+    
+    Embedded videos and JPEG/PNG media are already compressed, so deflating them
+    mostly burns CPU on large video decks; storing trades file size for save time.
+    """
+    
+    store_xml = True  # False: only /ppt/media/ parts are stored, XML is still deflated
+    
+    def _write(self):
+        with zipfile.ZipFile(self._pkg_file, 'w', compression=zipfile.ZIP_STORED,
+                             strict_timestamps=False) as zipf:
+            def write(uri, blob):
+                stored = self.store_xml or uri.startswith('/ppt/media/')
+                zipf.writestr(uri.membername, blob,
+                              zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+            phys_writer = SimpleNamespace(write=write)
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+class _MediaStoredPackageWriter(_StoredPackageWriter):
+    """Stores only the already-compressed media parts (compression: media); the
+    slide XML still deflates well, so the file stays close to its normal size"""
+    
+    store_xml = False
+
+# Measured aspect ratios persisted across runs: path -> [mtime_ns, size, ar(, image format)]
+_AR_CACHE_FILE = Path.home() / '.cache' / 'gai_report' / 'ar_cache.json'
+# Entry cap for the file; the oldest entries (deleted/renamed media included) go first
+_AR_CACHE_MAX = 20000
+
+# Slide media type -> MediaPair path accessor
+_MEDIA_PATH_GETTERS = {
+    'source': attrgetter('source_path'),
+    'source_video': attrgetter('source_video_path'),
+    'additional_source': lambda pair: pair.additional_source_paths[0] if pair.additional_source_paths else None,
+    'generated': attrgetter('primary_generated'),
+    'reference': attrgetter('primary_reference'),
+}
+
+# Metadata box lines rendered as "<label>: <value><unit>"
+_METADATA_LABELS = {
+    'processing_time_seconds': ('Time', 's'),
+    'response_id': ('Response ID', ''),
+    'attempts': ('Attempts', ''),
+    'task_id': ('Task ID', ''),
+    'start_image': ('Start', ''),
+    'end_image': ('End', ''),
+    'source_image': ('Image', ''),
+    'source_video': ('Video', ''),
+    'animation_mode': ('Mode', ''),
+    'style_name': ('Style', ''),
+    'model_id': ('Model', ''),
+    'duration_seconds': ('Duration', 's'),
+    'aspect_ratio': ('Aspect', ''),
+    'resolution': ('Resolution', ''),
+    'model': ('Model', ''),
+    'mode': ('Mode', ''),
+    'duration': ('Duration', 's'),
+    'ratio': ('Ratio', ''),
+    'cfg': ('CFG', ''),
+}
+
+# Image formats PowerPoint can't embed even behind a supported extension
+_CONVERT_IMG_FORMATS = frozenset({'MPO', 'WEBP', 'SVG', 'HEIC', 'HEIF', 'AVIF'})
+
+# Encoded poster frames persisted across runs, content-addressed by path + stat
+# as frames/<h[:2]>/<h>.jpg; only the most recent ones also stay in memory
+_FRAME_CACHE_DIR = Path.home() / '.cache' / 'gai_report' / 'frames'
+_FRAME_CACHE_MAX = 256
+# Disk budget for cached frames; least recently used files are pruned past it
+_FRAME_CACHE_DISK_MAX = 512 << 20
+# Poster JPEG quality; a poster only shows until playback starts, and q85 is
+# a fraction of OpenCV's default q95 bytes to hash, store and zip on save
+_POSTER_JPEG_QUALITY = 85
+
+def _frame_digest(key):
+    """Stable 64-bit hex digest of a frame cache key (xxh3 when installed)"""
+    data = key.encode('utf-8', 'surrogateescape')
+    return xxhash.xxh3_64(data).hexdigest() if xxhash else hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def _jpeg_size(data):
+    """(width, height) of a JPEG that PIL can open and that runs through to its
+    EOI marker; None for anything empty, truncated or unreadable"""
+    if not (data.startswith(b'\xff\xd8') and data.endswith(b'\xff\xd9')):
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.format == 'JPEG' and img.width > 0 and img.height > 0:
+                return img.size
+    except Exception:
+        pass
+    return None
+
+# Placeholder types that can hold media (picture, object, chart, table, ...)
+_MEDIA_PH_TYPES = frozenset({6, 7, 8, 13, 18, 19})
+
+# Slide colors, built once and shared (RGBColor is an immutable tuple)
+_RED = RGBColor(255, 0, 0)               # Failure titles and error text/outline
+_ERROR_FILL = RGBColor(255, 240, 240)
+_PROMPT_FILL = RGBColor(245, 245, 245)
+_PROMPT_LINE = RGBColor(200, 200, 200)
+_WHITE = RGBColor(255, 255, 255)         # Metadata box
+
+# Filename hints used when media dimensions can't be read, checked in order
+_AR_HINTS = (
+    (re.compile(r'(?:^|_|-|\s)9[_-]16(?:$|_|-|\s)'), 'portrait', 9/16),
+    (re.compile(r'(?:^|_|-|\s)1[_-]1(?:$|_|-|\s)'), 'square', 1),
+    (re.compile(r'(?:^|_|-|\s)16[_-]9(?:$|_|-|\s)'), 'landscape', 16/9),
+)
+
+# Folder/file name patterns, compiled once instead of per call
+_DATE_PREFIX = re.compile(r'(\d{4})\s*(.+)')  # "1017 Effect Name" -> ("1017", "Effect Name")
+_DATE_PREFIX_STRIP = re.compile(r'^\d{4}\s+')
+_MODEL_VERSION = re.compile(r'(?:v)?(\d+[._-]\d+)(?:[._-]?turbo)?')
+_EFFECT_SUFFIX = re.compile(r'_effect$', re.IGNORECASE)
+_OUTPUT_SUFFIXES = tuple(re.compile(p, re.IGNORECASE) for p in (r'_generated', r'_output', r'_result'))
+
+# Slotted pairs (no per-instance __dict__) where dataclasses support it (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class MediaPair:
     """Universal media pair for all API types"""
     source_file: str
@@ -132,10 +343,23 @@ class UnifiedReportGenerator:
         
         # Caches for performance
         self._ar_cache = {}
-        self._frame_cache = {}
-        self._tempfiles_to_cleanup = []  # Track temporary files from format conversions
+        self._ar_disk_cache = self._load_ar_cache_from_disk()  # Survives across runs
+        self._ar_disk_dirty = False
+        self._frame_cache = {}  # Bounded to _FRAME_CACHE_MAX; misses fall back to disk
+        self._frame_lock = threading.Lock()
+        self._img_formats = {}  # path -> PIL format seen while probing the aspect ratio
+        self._present_media = set()  # paths the aspect-ratio probe stat()ed successfully
+        self._tempdir = None  # Directory for temporary format conversions, made on first use
+        self._tempdir_lock = threading.Lock()
+        self._img_format_cache = {}  # (path, mtime_ns) -> PowerPoint-ready image path
+        self._template_cache = {}  # (path, mtime_ns) -> template .pptx bytes
+        self._downscale_cache = {}  # (path, width_px, height_px) -> encoded image bytes or None
         self._normalize_cache = {}  # Cache for normalize_key operations
         self._extract_key_cache = {}  # Cache for video key extraction
+        self._effect_pattern_cache = {}  # effect name -> compiled removal patterns
+        self._scan_prefetch = {}  # folder -> scan result, consumed by _scan_directory_once
+        self._error_box_proto = None  # Styled error box <p:sp>, cloned for each failure
+        self._today_mmdd = datetime.now().strftime("%m%d")  # Date fallback for report names
         
         # Smart batching configuration
         self._batch_size = 50  # Process 50 items at a time
@@ -163,6 +387,10 @@ class UnifiedReportGenerator:
         self.load_config()
         self.load_report_definitions()
         
+        # Opt-in: embed images resampled to their on-slide size (see _downscaled_image)
+        self._downscale_images = bool(self.config.get('output', {}).get('downscale_images')
+                                      or self.config.get('downscale_images', False))
+        
         # Update Kling display name based on model in config
         if self.api_name in ['kling', 'kling_endframe', 'kling_ttv']:
             self._update_kling_display_name()
@@ -285,20 +513,53 @@ class UnifiedReportGenerator:
         slide_config = self.get_slide_config()
         grouped_pairs = self.group_pairs_if_needed(pairs, slide_config)
         
+        # Do the file I/O for every media file the slides will place up front,
+        # in parallel; python-pptx isn't thread-safe, so the slides themselves
+        # are still built serially below, from cache hits
+        media_types = set(slide_config.get('media_types', ['source', 'generated']))
+        media_types.update(slide_config.get('media_types_3', ()))
+        media = {}
+        for pair in pairs:
+            for media_type in media_types:
+                path, is_video = self.get_media_path_and_type(pair, media_type)
+                if path:
+                    media.setdefault(path, is_video)
+        self.prewarm_aspect_ratios(media.items())
+        # Format conversions (WEBP/MPO -> PNG) after the probes, which record formats
+        self._convert_unsupported_formats_batch(
+            [p for p, is_video in media.items() if not is_video and self._media_exists(p)])
+        
+        layouts = {}  # Slide layouts resolved once for the whole loop
         slide_index = 1
         for group_name, group_pairs in grouped_pairs.items():
             # Add section divider if needed
             if slide_config.get('use_section_dividers') and group_name != 'default':
-                self.create_section_divider_slide(ppt, group_name, template_loaded)
+                self.create_section_divider_slide(ppt, group_name, template_loaded, layouts)
             
             # Create individual slides
             for pair in group_pairs:
                 self.create_universal_slide(ppt, pair, slide_index, template_loaded, 
-                                          use_comparison, slide_config)
+                                          use_comparison, slide_config, layouts)
                 slide_index += 1
     
+    def _slide_layout(self, ppt, index, layouts):
+        """Layout of template slide `index` (None until it exists), or the blank
+        layout for index None; memoized in `layouts`
+        
+        ppt.slides[i] materializes the whole slide id list, so looking it up
+        for every new slide made deck building quadratic. A template slide
+        never moves once present, so its layout is safe to reuse.
+        """
+        layout = layouts.get(index)
+        if layout is None:
+            if index is None:
+                layout = layouts[None] = ppt.slide_layouts[6]
+            elif len(ppt.slides) > index:
+                layout = layouts[index] = ppt.slides[index].slide_layout
+        return layout
+    
     def create_universal_slide(self, ppt, pair, index, template_loaded,
-                              use_comparison, slide_config):
+                              use_comparison, slide_config, layouts=None):
         """Create a single slide for any API using configuration"""
         # Adjust media types for nano_banana based on whether multi-image mode is active
         if self.api_name == 'nano_banana':
@@ -310,11 +571,13 @@ class UnifiedReportGenerator:
             # else: use default 2-media layout from config (already set)
         
         # Create slide
-        if template_loaded and len(ppt.slides) >= 4:
-            slide = ppt.slides.add_slide(ppt.slides[3].slide_layout)
+        layouts = {} if layouts is None else layouts
+        template_layout = self._slide_layout(ppt, 3, layouts) if template_loaded else None
+        if template_layout is not None:
+            slide = ppt.slides.add_slide(template_layout)
             self.handle_template_slide(slide, pair, index, use_comparison, slide_config)
         else:
-            slide = ppt.slides.add_slide(ppt.slide_layouts[6])
+            slide = ppt.slides.add_slide(self._slide_layout(ppt, None, layouts))
             self.handle_manual_slide(slide, pair, index, use_comparison, slide_config)
     
     def _format_title(self, pair, index, title_format, show_only_if_failed):
@@ -341,18 +604,23 @@ class UnifiedReportGenerator:
             slide_config.get('title_show_only_if_failed', False)
         )
         
-        if title:
-            # Optimized: Find title placeholder directly
-            title_ph = next((p for p in slide.placeholders if p.placeholder_format.type == 1), None)
-            if title_ph:
-                title_ph.text = title
-                if pair.failed and title_ph.text_frame.paragraphs:
-                    title_ph.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 0, 0)
+        # Single pass over the placeholders: first title plus the media slots
+        title_ph, phs = None, []
+        for p in slide.placeholders:
+            ph_type = p.placeholder_format.type
+            if ph_type == 1:
+                if title_ph is None:
+                    title_ph = p
+            elif ph_type in _MEDIA_PH_TYPES:
+                phs.append(p)
+        phs.sort(key=attrgetter('left'))
+        
+        if title and title_ph:
+            title_ph.text = title
+            if pair.failed and title_ph.text_frame.paragraphs:
+                title_ph.text_frame.paragraphs[0].font.color.rgb = _RED
         
         # Handle media placeholders
-        phs = sorted([p for p in slide.placeholders 
-                     if p.placeholder_format.type in {6, 7, 8, 13, 18, 19}],
-                    key=lambda x: getattr(x, 'left', 0))
         
         media_types = slide_config.get('media_types', ['source', 'generated'])
         
@@ -377,7 +645,7 @@ class UnifiedReportGenerator:
             tb.text_frame.text = title
             tb.text_frame.paragraphs[0].font.size = Pt(20)
             if pair.failed:
-                tb.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 0, 0)
+                tb.text_frame.paragraphs[0].font.color.rgb = _RED
         
         # Add media using positions
         positions = slide_config.get('positions', [(2.59, 3.26, 12.5, 12.5), (18.78, 3.26, 12.5, 12.5)])
@@ -392,16 +660,9 @@ class UnifiedReportGenerator:
     
     def get_media_path_and_type(self, pair, media_type):
         """Get media path and determine if it's video"""
-        path_map = {
-            'source': pair.source_path,
-            'source_video': pair.source_video_path,
-            'additional_source': pair.additional_source_paths[0] if pair.additional_source_paths else None,
-            'generated': pair.primary_generated,
-            'reference': pair.primary_reference,
-            'prompt': None  # Special type for text-to-video prompt display
-        }
-        
-        path = path_map.get(media_type)
+        # Resolve only the requested slot ('prompt' and unknown types have no path)
+        getter = _MEDIA_PATH_GETTERS.get(media_type)
+        path = getter(pair) if getter else None
         # For text-to-video APIs (veo, kling_ttv), generated content is always video
         is_video = (media_type in ['source_video', 'generated'] and self.api_name in ['veo', 'kling_ttv']) or \
                    (media_type == 'source_video') or \
@@ -458,20 +719,41 @@ class UnifiedReportGenerator:
     # ================== UNIFIED MEDIA SYSTEM ==================
     
     def ensure_supported_img_format(self, img_path):
-        """Convert any unsupported image format to PNG for PowerPoint compatibility"""
+        """Convert any unsupported image format to PNG for PowerPoint compatibility
+        
+        Results are memoized per (path, mtime) so an image reused across many
+        slides (e.g. a reference image in all_combinations) is decoded and
+        converted only once.
+        """
+        try:
+            key = (str(img_path), os.stat(img_path).st_mtime_ns)
+        except OSError:
+            return self._ensure_supported_img_format(img_path)
+        result = self._img_format_cache.get(key)
+        if result is None:
+            result = self._img_format_cache[key] = self._ensure_supported_img_format(img_path)
+        return result
+    
+    def _ensure_supported_img_format(self, img_path):
+        """Uncached worker for ensure_supported_img_format"""
         p = Path(img_path)
         
         # PowerPoint natively supports: jpg, jpeg, png, bmp, gif, tiff, tif
         # We'll convert everything else (webp, svg, mpo, etc.) to PNG
         needs_conversion = p.suffix.lower() not in self.SUPPORTED_IMG_FORMATS
         
+        # get_aspect_ratio already read the real format from the header
+        known_format = self._img_formats.get(str(img_path))
+        if known_format and not needs_conversion and known_format not in _CONVERT_IMG_FORMATS:
+            return str(img_path)
+        
         # Always try to open and check the actual format, not just extension
         # Some files like .jpg might actually be MPO format
         try:
             with Image.open(p) as im:
                 # Check actual image format - MPO and other exotic formats need conversion
                 actual_format = im.format
-                if actual_format in ('MPO', 'WEBP', 'SVG', 'HEIC', 'HEIF', 'AVIF'):
+                if actual_format in _CONVERT_IMG_FORMATS:
                     needs_conversion = True
                     logger.info(f"Detected {actual_format} format in {p.name}, will convert")
                 
@@ -480,10 +762,9 @@ class UnifiedReportGenerator:
                     # Use RGBA for formats that might have transparency
                     mode = 'RGBA' if im.mode in ('RGBA', 'LA', 'P') else 'RGB'
                     rgb_im = im.convert(mode)
-                    tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+                    tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False, dir=self._temp_dir())
                     rgb_im.save(tmp.name, 'PNG')
                     tmp.close()
-                    self._tempfiles_to_cleanup.append(tmp.name)
                     logger.info(f"Converted {actual_format or p.suffix} to PNG: {p.name}")
                     return tmp.name
                 else:
@@ -499,6 +780,37 @@ class UnifiedReportGenerator:
         
         return str(img_path)
     
+    def _downscaled_image(self, img_path, width, height):
+        """Image resampled to 2x its on-slide pixel size, as a stream for add_picture
+        
+        Full-resolution photos shown at ~15cm bloat the deck and its zip save.
+        Returns None when the image is already small enough (or can't be read),
+        in which case the original file is embedded. Images with transparency
+        stay PNG; everything else becomes a quality-85 JPEG (EXIF kept).
+        """
+        # 9525 EMU per pixel at 96 DPI, doubled for high-density displays
+        target = (max(1, int(width / 9525 * 2)), max(1, int(height / 9525 * 2)))
+        key = (str(img_path), *target)
+        if key not in self._downscale_cache:
+            data = None
+            try:
+                with Image.open(img_path) as im:
+                    if im.width > target[0] or im.height > target[1]:
+                        has_alpha = im.mode in ('RGBA', 'LA', 'P') and (im.mode != 'P' or 'transparency' in im.info)
+                        exif = im.info.get('exif')
+                        im.thumbnail(target, Image.LANCZOS)
+                        buf = io.BytesIO()
+                        if has_alpha:
+                            im.save(buf, 'PNG', optimize=True)
+                        else:
+                            im.convert('RGB').save(buf, 'JPEG', quality=85, optimize=True, **({'exif': exif} if exif else {}))
+                        data = buf.getvalue()
+            except Exception as e:
+                logger.warning(f"Could not downscale {Path(img_path).name}: {e}")
+            self._downscale_cache[key] = data
+        data = self._downscale_cache[key]
+        return io.BytesIO(data) if data else None
+    
     def _convert_unsupported_formats_batch(self, image_paths):
         """Convert multiple unsupported image formats in parallel for major performance gain"""
         if not image_paths:
@@ -525,8 +837,7 @@ class UnifiedReportGenerator:
         def load_one(key_path_tuple):
             key, path = key_path_tuple
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return (key, json.load(f))
+                return (key, _load_json_file(path))
             except Exception as e:
                 logger.warning(f"Failed to load JSON {path.name}: {e}")
                 return (key, {})
@@ -574,15 +885,15 @@ class UnifiedReportGenerator:
             box.text_frame.text = prompt_text
             box.text_frame.word_wrap = True
             box.fill.solid()
-            box.fill.fore_color.rgb = RGBColor(245, 245, 245)
-            box.line.color.rgb = RGBColor(200, 200, 200)
+            box.fill.fore_color.rgb = _PROMPT_FILL
+            box.line.color.rgb = _PROMPT_LINE
             box.line.width = Pt(1)
             for para in box.text_frame.paragraphs:
                 para.font.size = Pt(11)
                 para.alignment = PP_ALIGN.LEFT
             return
         
-        if media_path and Path(media_path).exists():
+        if media_path and self._media_exists(media_path):
             try:
                 # Calculate aspect ratio and positioning for all media types
                 ar = self.get_aspect_ratio(Path(media_path), is_video)
@@ -590,17 +901,19 @@ class UnifiedReportGenerator:
                 fl, ft = l + (w - sw)/2, t + (h - sh)/2
                 
                 if is_video:
-                    # Extract first frame for video poster
-                    first_frame_path = self.extract_first_frame(Path(media_path))
-                    if first_frame_path and Path(first_frame_path).exists():
+                    # Extract first frame for video poster (encoded JPEG bytes,
+                    # kept in memory so there is no temp file to write and re-read)
+                    first_frame = self.extract_first_frame(Path(media_path))
+                    if first_frame:
                         slide.shapes.add_movie(str(media_path), fl, ft, sw, sh,
-                                             poster_frame_image=first_frame_path)
+                                             poster_frame_image=io.BytesIO(first_frame))
                     else:
                         slide.shapes.add_movie(str(media_path), fl, ft, sw, sh)
                 else:
                     # Convert any unsupported image format to PNG if needed
                     converted_path = self.ensure_supported_img_format(media_path)
-                    slide.shapes.add_picture(str(converted_path), fl, ft, sw, sh)
+                    picture = self._downscaled_image(converted_path, sw, sh) if self._downscale_images else None
+                    slide.shapes.add_picture(picture or str(converted_path), fl, ft, sw, sh)
             except Exception as e:
                 self.add_error_box(slide, l, t, w, h, f"Failed to load media: {e}", pair)
         else:
@@ -631,20 +944,49 @@ class UnifiedReportGenerator:
         return "Media not found"
     
     def add_error_box(self, slide, left, top, width, height, message: str, pair=None):
-        """Add error box with proper styling"""
-        box = slide.shapes.add_textbox(left, top, width, height)
-        box.text_frame.text = f"❌ GENERATION FAILED\n\n{message}"
-        box.text_frame.word_wrap = True
+        """Add error box with proper styling
         
-        for para in box.text_frame.paragraphs:
-            para.font.size = Pt(12)  # Slightly smaller to fit more text
-            para.alignment = PP_ALIGN.CENTER
-            para.font.color.rgb = RGBColor(255, 0, 0)
+        The first box is styled through python-pptx and kept as a prototype;
+        later boxes clone its XML and only patch id, geometry and text.
+        """
+        text = f"❌ GENERATION FAILED\n\n{message}"
         
-        box.fill.solid()
-        box.fill.fore_color.rgb = RGBColor(255, 240, 240)
-        box.line.color.rgb = RGBColor(255, 0, 0)
-        box.line.width = Pt(0.5)
+        if self._error_box_proto is None:
+            box = slide.shapes.add_textbox(left, top, width, height)
+            box.text_frame.text = text
+            box.text_frame.word_wrap = True
+            
+            for para in box.text_frame.paragraphs:
+                para.font.size = Pt(12)  # Slightly smaller to fit more text
+                para.alignment = PP_ALIGN.CENTER
+                para.font.color.rgb = _RED
+            
+            box.fill.solid()
+            box.fill.fore_color.rgb = _ERROR_FILL
+            box.line.color.rgb = _RED
+            box.line.width = Pt(0.5)
+            self._error_box_proto = deepcopy(box._element)
+            return
+        
+        sp = deepcopy(self._error_box_proto)
+        shape_id = slide.shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"TextBox {shape_id - 1}"
+        slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+        box = slide.shapes._shape_factory(sp)
+        box.left, box.top, box.width, box.height = left, top, width, height
+        
+        # Reuse the styled first paragraph (pPr only) for every line of text
+        txBody = sp.txBody
+        para_proto = txBody.p_lst[0]
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        for line in text.split('\n'):
+            p = deepcopy(para_proto)
+            for elm in p.content_children:
+                p.remove(elm)
+            p.append_text(line)
+            txBody.append(p)
     
     # ================== UNIFIED METADATA SYSTEM ==================
     
@@ -652,31 +994,6 @@ class UnifiedReportGenerator:
         """Add a single metadata field to meta_lines"""
         md = pair.metadata or {}
         
-        field_handlers = {
-            'success': lambda: f"Status: {'✓' if md.get('success', False) else '❌'}",
-            'processing_time_seconds': lambda: f"Time: {md.get(field, 'N/A')}s",
-            'response_id': lambda: f"Response ID: {md.get(field, 'N/A')}",
-            'attempts': lambda: f"Attempts: {md.get(field, 'N/A')}",
-            'task_id': lambda: f"Task ID: {md.get(field, 'N/A')}",
-            'effect_name': lambda: f"Effect: {pair.effect_name}",
-            'category': lambda: f"Category: {pair.category}",
-            'start_image': lambda: f"Start: {md.get(field, 'N/A')}",
-            'end_image': lambda: f"End: {md.get(field, 'N/A')}",
-            'source_image': lambda: f"Image: {md.get(field, 'N/A')}",
-            'source_video': lambda: f"Video: {md.get(field, 'N/A')}",
-            'animation_mode': lambda: f"Mode: {md.get(field, 'N/A')}",
-            'style_name': lambda: f"Style: {md.get(field, 'N/A')}",
-            'model_id': lambda: f"Model: {md.get(field, 'N/A')}",
-            'duration_seconds': lambda: f"Duration: {md.get(field, 'N/A')}s",
-            'aspect_ratio': lambda: f"Aspect: {md.get(field, 'N/A')}",
-            'resolution': lambda: f"Resolution: {md.get(field, 'N/A')}",
-            'model': lambda: f"Model: {md.get(field, 'N/A')}",
-            'mode': lambda: f"Mode: {md.get(field, 'N/A')}",
-            'duration': lambda: f"Duration: {md.get(field, 'N/A')}s",
-            'ratio': lambda: f"Ratio: {md.get(field, 'N/A')}",
-            'cfg': lambda: f"CFG: {md.get(field, 'N/A')}",
-        }
-        
         # Special handlers
         if field == 'additional_images_used':
             add_imgs = md.get(field, [])
@@ -689,11 +1006,19 @@ class UnifiedReportGenerator:
             if gen_num and total_gens > 1:
                 meta_lines.append(f"Generation: {gen_num}/{total_gens}")
         elif field in ['prompt', 'img_prompt']:
-            value = md.get(field, 'N/A')
-            text = f"{str(value)[:60]}..." if len(str(value)) > 60 else str(value)
+            text = str(md.get(field, 'N/A'))
+            if len(text) > 60:
+                text = f"{text[:60]}..."
             meta_lines.append(f"Prompt: {text}")
-        elif field in field_handlers:
-            meta_lines.append(field_handlers[field]())
+        elif field == 'success':
+            meta_lines.append(f"Status: {'✓' if md.get('success', False) else '❌'}")
+        elif field == 'effect_name':
+            meta_lines.append(f"Effect: {pair.effect_name}")
+        elif field == 'category':
+            meta_lines.append(f"Category: {pair.category}")
+        elif field in _METADATA_LABELS:
+            label, unit = _METADATA_LABELS[field]
+            meta_lines.append(f"{label}: {md.get(field, 'N/A')}{unit}")
         else:
             # Generic field
             value = md.get(field, 'N/A')
@@ -724,26 +1049,30 @@ class UnifiedReportGenerator:
         box.text_frame.text = "\n".join(meta_lines)
         box.text_frame.word_wrap = True
         box.fill.solid()
-        box.fill.fore_color.rgb = RGBColor(255, 255, 255)
+        box.fill.fore_color.rgb = _WHITE
         
         for para in box.text_frame.paragraphs:
             para.font.size = Pt(10)
     
-    def create_section_divider_slide(self, ppt, effect_name, template_loaded):
+    def create_section_divider_slide(self, ppt, effect_name, template_loaded, layouts=None):
         """Create section divider slide for effects"""
-        if template_loaded and len(ppt.slides) >= 2:
-            slide = ppt.slides.add_slide(ppt.slides[1].slide_layout)
-            # Set title in placeholder
-            for p in slide.placeholders:
-                if p.placeholder_format.type == 1:  # Title placeholder
-                    p.text = f"{effect_name}"
-                    if p.text_frame.paragraphs:
-                        p.text_frame.paragraphs[0].font.size = Pt(48)
-                        p.text_frame.paragraphs[0].font.bold = True
-                        p.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-                    break
+        layouts = {} if layouts is None else layouts
+        divider_layout = self._slide_layout(ppt, 1, layouts) if template_loaded else None
+        if divider_layout is not None:
+            slide = ppt.slides.add_slide(divider_layout)
+            # Set title in placeholder; shapes.title finds the usual idx-0 title
+            # directly, other layouts fall back to scanning the placeholders
+            p = slide.shapes.title
+            if p is None or p.placeholder_format.type != 1:  # Title placeholder
+                p = next((ph for ph in slide.placeholders if ph.placeholder_format.type == 1), None)
+            if p is not None:
+                p.text = f"{effect_name}"
+                if p.text_frame.paragraphs:
+                    p.text_frame.paragraphs[0].font.size = Pt(48)
+                    p.text_frame.paragraphs[0].font.bold = True
+                    p.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
         else:
-            slide = ppt.slides.add_slide(ppt.slide_layouts[6])
+            slide = ppt.slides.add_slide(self._slide_layout(ppt, None, layouts))
             # Add title text box
             tb = slide.shapes.add_textbox(Cm(5), Cm(8), Cm(24), Cm(4))
             tb.text_frame.text = f"{effect_name}"
@@ -799,26 +1128,19 @@ class UnifiedReportGenerator:
         pairs = []
         
         # Define folder structure based on API
+        src_dir = folder / 'Source'
         if self.api_name == 'nano_banana':
-            folders = {
-                'source': folder / 'Source',
-                'generated': folder / 'Generated_Output',
-                'metadata': folder / 'Metadata'
-            }
+            gen_dir = folder / 'Generated_Output'
             file_pattern = 'image'
         else:  # kling or kling_endframe
-            folders = {
-                'source': folder / 'Source',
-                'generated': folder / 'Generated_Video',
-                'metadata': folder / 'Metadata'
-            }
+            gen_dir = folder / 'Generated_Video'
             file_pattern = 'generated'
         
-        if not folders['source'].exists():
+        if not src_dir.exists():
             return pairs
         
         # OPTIMIZED: Single-pass directory scanning
-        src_imgs, _, _ = self._scan_directory_once(folders['source'])
+        src_imgs, _, _ = self._scan_directory_once(src_dir)
         
         # For kling_endframe, filter to only A images (start frames)
         # B images are end frames and are referenced in metadata, not source for pairs
@@ -829,16 +1151,16 @@ class UnifiedReportGenerator:
         
         # Get generated files with single scan
         out = {}
-        if folders['generated'].exists():
+        if gen_dir.exists():
             if self.api_name == 'nano_banana':
-                gen_imgs, _, _ = self._scan_directory_once(folders['generated'])
+                gen_imgs, _, _ = self._scan_directory_once(gen_dir)
                 for key, f in gen_imgs.items():
                     if file_pattern in f.name:
                         # Split on 'image' and remove trailing underscore
                         basename = f.name.split(file_pattern)[0].rstrip('_')
                         out.setdefault(self.normalize_key(basename), []).append(f)
             else:  # kling or kling_endframe
-                _, gen_vids, _ = self._scan_directory_once(folders['generated'])
+                _, gen_vids, _ = self._scan_directory_once(gen_dir)
                 for key, f in gen_vids.items():
                     if file_pattern in f.name:
                         # Extract basename by splitting on '_generated' pattern
@@ -847,7 +1169,7 @@ class UnifiedReportGenerator:
                         out.setdefault(self.normalize_key(basename), []).append(f)
         
         # Get metadata with single scan and batch load
-        _, _, metadata_files = self._scan_directory_once(folders['metadata'])
+        _, _, metadata_files = self._scan_directory_once(folder / 'Metadata')
         metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
         
         # Get reference files
@@ -855,22 +1177,33 @@ class UnifiedReportGenerator:
         if use_comparison and ref_folder:
             ref_generated_folder = ref_folder / ('Generated_Output' if self.api_name == 'nano_banana' else 'Generated_Video')
             if ref_generated_folder.exists():
-                for f in ref_generated_folder.iterdir():
+                with os.scandir(ref_generated_folder) as it:
+                    ref_names = [e.name for e in it]
+                for name in ref_names:
+                    stem, suffix = os.path.splitext(name)
+                    suffix = suffix.lower()
                     if self.api_name == 'nano_banana':
-                        if f.suffix.lower() in {'.jpg', '.jpeg', '.png', '.webp'} and 'image' in f.name:
+                        if suffix in {'.jpg', '.jpeg', '.png', '.webp'} and 'image' in name:
                             # Split on 'image' and remove trailing underscore
-                            basename = f.name.split('image')[0].rstrip('_')
-                            ref_files.setdefault(self.normalize_key(basename), []).append(f)
+                            basename = name.split('image')[0].rstrip('_')
+                            ref_files.setdefault(self.normalize_key(basename), []).append(ref_generated_folder / name)
                     else:  # kling or kling_endframe
-                        if f.suffix.lower() in {'.mp4', '.mov', '.avi'} and 'generated' in f.name:
+                        if suffix in {'.mp4', '.mov', '.avi'} and 'generated' in name:
                             # Extract basename by splitting on '_generated' pattern
-                            basename = f.stem.split('_generated')[0]
-                            ref_files[self.normalize_key(basename)] = f
+                            basename = stem.split('_generated')[0]
+                            ref_files[self.normalize_key(basename)] = ref_generated_folder / name
         
         # Pre-compute aspect ratios for all source images
         all_media = list(src.values()) + [p for paths in out.values() for p in paths if isinstance(paths, list)]
         if all_media:
             are_videos = {p: p.suffix.lower() in self.VIDEO_EXTS for p in all_media}
+            
+            # Pre-extract poster frames in parallel instead of one by one per slide;
+            # this also fills the aspect-ratio cache for every video
+            all_videos = [p for p, is_vid in are_videos.items() if is_vid]
+            all_videos += [f for f in ref_files.values() if isinstance(f, Path)]
+            if all_videos:
+                self._extract_frames_parallel(all_videos)
             self._compute_aspect_ratios_batch(all_media, are_videos=are_videos)
         
         # Create pairs
@@ -899,7 +1232,7 @@ class UnifiedReportGenerator:
                 effect_name = self.config.get('effect') or self.config.get('effect_name')
             if not effect_name:
                 # Remove leading date (e.g., '1001 ') from folder name
-                m = re.match(r'^(\d{4})\s*(.+)', folder.name)
+                m = _DATE_PREFIX.match(folder.name)
                 effect_name = m.group(2) if m else folder.name
 
             # For Nano Banana multi-image mode: resolve additional source images from metadata
@@ -959,33 +1292,26 @@ class UnifiedReportGenerator:
     def create_runway_media_pairs(self, folder: Path, ref_folder: Optional[Path],
                                  task: Dict, use_comparison: bool) -> List[MediaPair]:
         """Create Runway media pairs"""
-        folders = {
-            'reference': folder / 'Reference',
-            'source': folder / 'Source',
-            'generated': folder / 'Generated_Video',
-            'metadata': folder / 'Metadata'
-        }
-        
-        ref_folders = {
-            'video': ref_folder / 'Generated_Video',
-            'metadata': ref_folder / 'Metadata'
-        } if ref_folder and use_comparison else {}
-        
-        if not folders['metadata'].exists():
-            logger.warning(f"Metadata folder not found: {folders['metadata']}")
+        meta_dir = folder / 'Metadata'
+        if not meta_dir.exists():
+            logger.warning(f"Metadata folder not found: {meta_dir}")
             return []
         
         # OPTIMIZED: Use single-pass scanning for all folders
-        reference_images, _, _ = self._scan_directory_once(folders['reference'])
-        _, source_videos, _ = self._scan_directory_once(folders['source'])
-        _, generated_videos, _ = self._scan_directory_once(folders['generated'])
-        _, _, metadata_files = self._scan_directory_once(folders['metadata'])
-        _, ref_videos, ref_metadata_raw = self._scan_directory_once(ref_folders.get('video', Path()))
-        _, _, ref_metadata = self._scan_directory_once(ref_folders.get('metadata', Path()))
+        reference_images, _, _ = self._scan_directory_once(folder / 'Reference')
+        _, source_videos, _ = self._scan_directory_once(folder / 'Source')
+        _, generated_videos, _ = self._scan_directory_once(folder / 'Generated_Video')
+        _, _, metadata_files = self._scan_directory_once(meta_dir)
+        if ref_folder and use_comparison:
+            _, ref_videos, _ = self._scan_directory_once(ref_folder / 'Generated_Video')
+            _, _, ref_metadata = self._scan_directory_once(ref_folder / 'Metadata')
+        else:
+            ref_videos, ref_metadata = {}, {}
         
-        # Batch load all metadata
-        metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
-        ref_metadata_cache = self._load_json_batch(ref_metadata) if ref_metadata else {}
+        # Batch load all metadata, current and reference, in one parallel pass
+        loaded = self._load_json_batch({p: p for p in (*metadata_files.values(), *ref_metadata.values())})
+        metadata_cache = {k: loaded[p] for k, p in metadata_files.items()}
+        ref_metadata_cache = {k: loaded[p] for k, p in ref_metadata.items()}
         
         logger.info(f"Runway files found: {len(reference_images)} refs, {len(source_videos)} sources, "
                    f"{len(generated_videos)} generated, {len(metadata_files)} metadata")
@@ -995,6 +1321,11 @@ class UnifiedReportGenerator:
         if all_videos:
             self._extract_frames_parallel(all_videos)
         
+        # Index files by name once; metadata refers to them by file name
+        reference_by_name = {p.name: p for p in reference_images.values()}
+        source_by_name = {p.name: p for p in source_videos.values()}
+        generated_by_name = {p.name: p for p in generated_videos.values()}
+        
         pairs = []
         for stem, meta_path in metadata_files.items():
             md = metadata_cache.get(stem, {})
@@ -1002,12 +1333,9 @@ class UnifiedReportGenerator:
                 continue
             
             # Find matching files using metadata references
-            ref_img_path = next((p for p in reference_images.values()
-                               if p.name == md.get('reference_image', '')), None)
-            src_vid_path = next((p for p in source_videos.values()
-                               if p.name == md.get('source_video', '')), None)
-            gen_vid_path = next((p for p in generated_videos.values()
-                               if p.name == md.get('generated_video', '')), None)
+            ref_img_path = reference_by_name.get(md.get('reference_image', ''))
+            src_vid_path = source_by_name.get(md.get('source_video', ''))
+            gen_vid_path = generated_by_name.get(md.get('generated_video', ''))
             
             # Determine source file and path
             source_file = None
@@ -1060,22 +1388,16 @@ class UnifiedReportGenerator:
         - Generated_Video/: Generated videos (named as image_video_mode.mp4)
         - Metadata/: JSON metadata files (named as image_video_metadata.json)
         """
-        folders = {
-            'source_image': folder / 'Source Image',
-            'source_video': folder / 'Source Video',
-            'generated': folder / 'Generated_Video',
-            'metadata': folder / 'Metadata'
-        }
-        
-        if not folders['metadata'].exists():
-            logger.warning(f"Metadata folder not found: {folders['metadata']}")
+        meta_dir = folder / 'Metadata'
+        if not meta_dir.exists():
+            logger.warning(f"Metadata folder not found: {meta_dir}")
             return []
         
         # OPTIMIZED: Use single-pass scanning for all folders
-        source_images, _, _ = self._scan_directory_once(folders['source_image'])
-        _, source_videos, _ = self._scan_directory_once(folders['source_video'])
-        _, generated_videos, _ = self._scan_directory_once(folders['generated'])
-        _, _, metadata_files = self._scan_directory_once(folders['metadata'])
+        source_images, _, _ = self._scan_directory_once(folder / 'Source Image')
+        _, source_videos, _ = self._scan_directory_once(folder / 'Source Video')
+        _, generated_videos, _ = self._scan_directory_once(folder / 'Generated_Video')
+        _, _, metadata_files = self._scan_directory_once(meta_dir)
         
         # Batch load all metadata
         metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
@@ -1088,6 +1410,11 @@ class UnifiedReportGenerator:
         if all_videos:
             self._extract_frames_parallel(all_videos)
         
+        # Index files by name once; metadata refers to them by file name
+        source_image_by_name = {p.name: p for p in source_images.values()}
+        source_by_name = {p.name: p for p in source_videos.values()}
+        generated_by_name = {p.name: p for p in generated_videos.values()}
+        
         pairs = []
         for stem, meta_path in metadata_files.items():
             md = metadata_cache.get(stem, {})
@@ -1095,12 +1422,9 @@ class UnifiedReportGenerator:
                 continue
             
             # Find matching files using metadata references
-            src_img_path = next((p for p in source_images.values()
-                               if p.name == md.get('source_image', '')), None)
-            src_vid_path = next((p for p in source_videos.values()
-                               if p.name == md.get('source_video', '')), None)
-            gen_vid_path = next((p for p in generated_videos.values()
-                               if p.name == md.get('generated_video', '')), None)
+            src_img_path = source_image_by_name.get(md.get('source_image', ''))
+            src_vid_path = source_by_name.get(md.get('source_video', ''))
+            gen_vid_path = generated_by_name.get(md.get('generated_video', ''))
             
             if not src_img_path:
                 logger.warning(f"No source image found for meta {stem}")
@@ -1110,7 +1434,7 @@ class UnifiedReportGenerator:
             effect_name = self.config.get('effect') or self.config.get('effect_name')
             if not effect_name:
                 # Remove leading date (e.g., '1111 ') from folder name
-                m = re.match(r'^(\d{4})\s*(.+)', folder.name)
+                m = _DATE_PREFIX.match(folder.name)
                 effect_name = m.group(2) if m else folder.name
             
             pair = MediaPair(
@@ -1144,6 +1468,23 @@ class UnifiedReportGenerator:
         logger.info(f"Processing {self.api_name} base folder: {base_folder}")
         pairs = []
         
+        # Scan the folders of the effects the loops below will visit up front,
+        # in parallel; the loops then pick the results up instead of listing serially
+        if self.api_name == "vidu_reference" and not task.get('effect'):
+            # Discovers its effects from the base folder, like the loop below
+            with os.scandir(base_folder) as it:
+                effect_names = [e.name for e in it if e.is_dir() and not e.name.startswith('.')
+                                and os.path.exists(os.path.join(e.path, 'Source'))]
+        else:
+            # The other APIs process the requested effect or the configured tasks;
+            # kling_effects names folders by custom_effect first
+            use_custom = self.api_name == "kling_effects"
+            single = task.get('effect') or (use_custom and task.get('custom_effect'))
+            effect_names = [(use_custom and t.get('custom_effect')) or t.get('effect', '')
+                            for t in ([task] if single else self.config.get('tasks', []))]
+        self._prefetch_scans([base_folder / effect / sub for effect in effect_names if effect
+                              for sub in ('Source', 'Generated_Video', 'Metadata')])
+        
         if self.api_name == "vidu_effects":
             # Process each effect folder
             # Support single-task filtering for grouped processing
@@ -1155,31 +1496,35 @@ class UnifiedReportGenerator:
                 if not effect:
                     continue
                 
-                folders = {k: base_folder / effect / v
-                          for k, v in {'src': 'Source', 'vid': 'Generated_Video', 'meta': 'Metadata'}.items()}
+                effect_dir = base_folder / effect
+                src_dir = effect_dir / 'Source'
                 
-                if not folders['src'].exists():
+                if not src_dir.exists():
                     logger.warning(f"Source folder not found for effect: {effect}")
                     continue
                 
                 logger.info(f"Processing Vidu effect: {effect}")
                 
                 # OPTIMIZED: Single-pass directory scanning
-                images, _, _ = self._scan_directory_once(folders['src'])
+                images, _, _ = self._scan_directory_once(src_dir)
                 
-                _, raw_videos, _ = self._scan_directory_once(folders['vid'])
+                _, raw_videos, _ = self._scan_directory_once(effect_dir / 'Generated_Video')
                 videos = {}
                 for f in raw_videos.values():
                     key = self.extract_video_key(f.name, effect)
                     videos[key] = f
                 
-                _, _, metadata_files = self._scan_directory_once(folders['meta'])
+                _, _, metadata_files = self._scan_directory_once(effect_dir / 'Metadata')
                 
                 # Batch load metadata
                 metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
                 
                 logger.info(f"Images: {len(images)}, Videos: {len(videos)}, Meta {len(metadata_files)}")
                 
+                # Pre-extract poster frames (also caches video aspect ratios)
+                if videos:
+                    self._extract_frames_parallel(list(videos.values()))
+                
                 # Pre-compute aspect ratios
                 all_media = list(images.values()) + list(videos.values())
                 if all_media:
@@ -1213,8 +1558,10 @@ class UnifiedReportGenerator:
             else:
                 # All effects mode (default)
                 try:
-                    effect_names = sorted([f.name for f in base_folder.iterdir()
-                                         if f.is_dir() and not f.name.startswith('.') and (f / 'Source').exists()])
+                    with os.scandir(base_folder) as it:
+                        effect_names = sorted([e.name for e in it
+                                               if e.is_dir() and not e.name.startswith('.')
+                                               and os.path.exists(os.path.join(e.path, 'Source'))])
                     logger.info(f"Discovered {len(effect_names)} effect folders")
                 except:
                     effect_names = [t.get('effect', '') for t in self.config.get('tasks', [])]
@@ -1224,28 +1571,32 @@ class UnifiedReportGenerator:
                 if not effect:
                     continue
                 
-                folders = {k: base_folder / effect / v
-                          for k, v in {'src': 'Source', 'vid': 'Generated_Video', 'meta': 'Metadata'}.items()}
+                effect_dir = base_folder / effect
+                src_dir = effect_dir / 'Source'
                 
-                if not folders['src'].exists():
+                if not src_dir.exists():
                     logger.warning(f"Source folder not found for effect: {effect}")
                     continue
                 
                 logger.info(f"Processing Vidu Reference effect: {effect}")
                 
                 # OPTIMIZED: Single-pass directory scanning
-                images, _, _ = self._scan_directory_once(folders['src'])
+                images, _, _ = self._scan_directory_once(src_dir)
                 
-                _, raw_videos, _ = self._scan_directory_once(folders['vid'])
+                _, raw_videos, _ = self._scan_directory_once(effect_dir / 'Generated_Video')
                 videos = {}
                 for f in raw_videos.values():
                     videos[self.extract_key_reference(f.name, effect)] = f
                 
-                _, _, metadata_files = self._scan_directory_once(folders['meta'])
+                _, _, metadata_files = self._scan_directory_once(effect_dir / 'Metadata')
                 
                 # Batch load metadata
                 metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
                 
+                # Pre-extract poster frames (also caches video aspect ratios)
+                if videos:
+                    self._extract_frames_parallel(list(videos.values()))
+                
                 # Pre-compute aspect ratios
                 all_media = list(images.values()) + list(videos.values())
                 if all_media:
@@ -1280,26 +1631,30 @@ class UnifiedReportGenerator:
                 if not effect:
                     continue
                 
-                folders = {k: base_folder / effect / v
-                          for k, v in {'src': 'Source', 'vid': 'Generated_Video', 'meta': 'Metadata'}.items()}
+                effect_dir = base_folder / effect
+                src_dir = effect_dir / 'Source'
                 
-                if not folders['src'].exists():
+                if not src_dir.exists():
                     continue
                 
                 # OPTIMIZED: Single-pass directory scanning
-                images, _, _ = self._scan_directory_once(folders['src'])
+                images, _, _ = self._scan_directory_once(src_dir)
                 
-                _, raw_videos, _ = self._scan_directory_once(folders['vid'])
+                _, raw_videos, _ = self._scan_directory_once(effect_dir / 'Generated_Video')
                 videos = {}
                 for f in raw_videos.values():
                     key = self.extract_video_key(f.name, effect)
                     videos[key] = f
                 
-                _, _, metadata_files = self._scan_directory_once(folders['meta'])
+                _, _, metadata_files = self._scan_directory_once(effect_dir / 'Metadata')
                 
                 # Batch load metadata
                 metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
                 
+                # Pre-extract poster frames (also caches video aspect ratios)
+                if videos:
+                    self._extract_frames_parallel(list(videos.values()))
+                
                 # Pre-compute aspect ratios
                 all_media = list(images.values()) + list(videos.values())
                 if all_media:
@@ -1335,32 +1690,36 @@ class UnifiedReportGenerator:
                 if not effect:
                     continue
                 
-                folders = {k: base_folder / effect / v
-                          for k, v in {'src': 'Source', 'vid': 'Generated_Video', 'meta': 'Metadata'}.items()}
+                effect_dir = base_folder / effect
+                src_dir = effect_dir / 'Source'
                 
-                if not folders['src'].exists():
+                if not src_dir.exists():
                     logger.warning(f"Source folder not found for effect: {effect}")
                     continue
                 
                 logger.info(f"Processing Kling effect: {effect}")
                 
                 # OPTIMIZED: Single-pass directory scanning
-                images, _, _ = self._scan_directory_once(folders['src'])
+                images, _, _ = self._scan_directory_once(src_dir)
                 
-                _, raw_videos, _ = self._scan_directory_once(folders['vid'])
+                _, raw_videos, _ = self._scan_directory_once(effect_dir / 'Generated_Video')
                 videos = {}
                 for f in raw_videos.values():
                     # Extract key by removing effect suffix pattern
                     key = self.extract_video_key(f.name, effect)
                     videos[key] = f
                 
-                _, _, metadata_files = self._scan_directory_once(folders['meta'])
+                _, _, metadata_files = self._scan_directory_once(effect_dir / 'Metadata')
                 
                 # Batch load metadata
                 metadata_cache = self._load_json_batch(metadata_files) if metadata_files else {}
                 
                 logger.info(f"Images: {len(images)}, Videos: {len(videos)}, Meta: {len(metadata_files)}")
                 
+                # Pre-extract poster frames (also caches video aspect ratios)
+                if videos:
+                    self._extract_frames_parallel(list(videos.values()))
+                
                 # Pre-compute aspect ratios
                 all_media = list(images.values()) + list(videos.values())
                 if all_media:
@@ -1384,6 +1743,7 @@ class UnifiedReportGenerator:
                     )
                     pairs.append(pair)
         
+        self._scan_prefetch.clear()
         return pairs
     
     def process_genvideo_batch(self, task: Dict) -> List[MediaPair]:
@@ -1403,19 +1763,26 @@ class UnifiedReportGenerator:
             return pairs
         
         # Process each source image
-        source_images = [f for f in source_folder.iterdir()
-                        if f.suffix.lower() in self.IMAGE_EXTS]
+        with os.scandir(source_folder) as it:
+            source_images = [Path(e.path) for e in it
+                             if os.path.splitext(e.name)[1].lower() in self.IMAGE_EXTS]
+        
+        # One listing of the generated folder replaces per-candidate exists() stats
+        with os.scandir(generated_folder) as it:
+            generated_files = {e.name: Path(e.path) for e in it}
         
         # Pre-load all possible metadata files
         potential_metadata = {}
         if metadata_folder.exists():
-            for mf in metadata_folder.iterdir():
-                if mf.suffix.lower() == '.json':
+            with os.scandir(metadata_folder) as it:
+                json_names = [entry.name for entry in it]
+            for name in json_names:
+                stem, suffix = os.path.splitext(name)
+                if suffix.lower() == '.json':
                     try:
-                        with open(mf, 'r', encoding='utf-8') as f:
-                            potential_metadata[mf.stem] = json.load(f)
+                        potential_metadata[stem] = _load_json_file(metadata_folder / name)
                     except Exception as e:
-                        logger.warning(f"Failed to load metadata {mf.name}: {e}")
+                        logger.warning(f"Failed to load metadata {name}: {e}")
         
         for src_img in source_images:
             basename = src_img.stem
@@ -1425,33 +1792,28 @@ class UnifiedReportGenerator:
             for key_pattern in [f"{basename}_{src_img.name}_metadata", f"{basename}_metadata", basename]:
                 if key_pattern in potential_metadata:
                     metadata = potential_metadata[key_pattern]
-                    logger.info(f"Found metadata for {basename}")
+                    logger.info("Found metadata for %s", basename)
                     break
             
             # Find generated image
-            gen_img = generated_folder / f"{basename}.jpg"
-            if not gen_img.exists():
-                for ext in ['.png', '.jpeg', '.webp']:
-                    alt_gen = generated_folder / f"{basename}_generated{ext}"
-                    if alt_gen.exists():
-                        gen_img = alt_gen
-                        break
+            candidates = [f"{basename}.jpg"] + [f"{basename}_generated{ext}" for ext in ['.png', '.jpeg', '.webp']]
+            gen_img = next((generated_files[c] for c in candidates if c in generated_files), None)
             
             pair = MediaPair(
                 source_file=src_img.name,
                 source_path=src_img,
                 api_type='genvideo',
-                generated_paths=[gen_img] if gen_img.exists() else [],
+                generated_paths=[gen_img] if gen_img else [],
                 reference_paths=[],
                 metadata=metadata,
-                failed=not gen_img.exists() or not metadata.get('success', False)
+                failed=gen_img is None or not metadata.get('success', False)
             )
             pairs.append(pair)
             
             if pair.failed:
-                logger.warning(f"Failed pair: {src_img.name}")
+                logger.warning("Failed pair: %s", src_img.name)
             else:
-                logger.info(f"Valid pair: {src_img.name} -> {gen_img.name}")
+                logger.info("Valid pair: %s -> %s", src_img.name, gen_img.name)
         
         logger.info(f"Created {len(pairs)} GenVideo media pairs")
         return pairs
@@ -1488,14 +1850,14 @@ class UnifiedReportGenerator:
             self._extract_frames_parallel(list(generated_videos.values()))
         
         # Create pairs from metadata (metadata drives the pairing for text-to-video)
+        generated_by_name = {p.name: p for p in generated_videos.values()}
         for stem, meta_path in metadata_files.items():
             md = metadata_cache.get(stem, {})
             if not md:
                 continue
             
             # Find matching generated video
-            gen_vid_path = next((p for p in generated_videos.values()
-                               if p.name == md.get('generated_video', '')), None)
+            gen_vid_path = generated_by_name.get(md.get('generated_video', ''))
             
             # Get style name for display
             style_name = md.get('style_name', 'Unknown')
@@ -1523,14 +1885,14 @@ class UnifiedReportGenerator:
         """Load API-specific configuration from YAML or JSON"""
         config_path = Path(self.config_file)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                # Detect format by extension
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
+            # Detect format by extension
+            if config_path.suffix.lower() in ['.yaml', '.yml']:
+                with open(config_path, 'r', encoding='utf-8') as f:
                     self.config = yaml.safe_load(f)
-                    logger.info(f"✓ Config loaded: {self.config_file} (YAML)")
-                else:
-                    self.config = json.load(f)
-                    logger.info(f"✓ Config loaded: {self.config_file} (JSON)")
+                logger.info(f"✓ Config loaded: {self.config_file} (YAML)")
+            else:
+                self.config = _load_json_file(config_path)
+                logger.info(f"✓ Config loaded: {self.config_file} (JSON)")
         except Exception as e:
             logger.error(f"✗ Config error: {e}")
             sys.exit(1)
@@ -1563,8 +1925,7 @@ class UnifiedReportGenerator:
         # If no exact match, try to extract version numbers
         if not display_name and model:
             # Try to extract version like "v2.1" or "2.1" from the model string
-            import re
-            match = re.search(r'(?:v)?(\d+[._-]\d+)(?:[._-]?turbo)?', model)
+            match = _MODEL_VERSION.search(model)
             if match:
                 version = match.group(1).replace('_', '.').replace('-', '.')
                 is_turbo = 'turbo' in model
@@ -1602,8 +1963,7 @@ class UnifiedReportGenerator:
         
         for def_path in definition_paths:
             try:
-                with open(def_path, 'r', encoding='utf-8') as f:
-                    all_definitions = json.load(f)
+                all_definitions = _load_json_file(def_path)
                 self.report_definitions = all_definitions.get(self.api_name, {}).get('report', {})
                 logger.info(f"✓ API definitions loaded from: {def_path}")
                 return
@@ -1626,8 +1986,8 @@ class UnifiedReportGenerator:
     def _extract_date_from_folder(self, folder):
         """Extract date from folder name or use current date"""
         folder_name = Path(folder).name if isinstance(folder, (str, Path)) else str(folder)
-        m = re.match(r'(\d{4})\s*(.+)', folder_name)
-        return m.group(1) if m else datetime.now().strftime("%m%d")
+        m = _DATE_PREFIX.match(folder_name)
+        return m.group(1) if m else self._today_mmdd
     
     def get_cmp_filename(self, folder1: str, folder2: str, model: str = '', effect_names1=None, effect_names2=None) -> str:
         """Generate comparison filename using API name and effect names"""
@@ -1677,7 +2037,7 @@ class UnifiedReportGenerator:
         if is_base_folder_api:
             # Base folder API (vidu_effects, etc.) - use base folder for date and effect names
             base_folder = grouped_task.get('base_folder', '')
-            d = self._extract_date_from_folder(base_folder) if base_folder else datetime.now().strftime("%m%d")
+            d = self._extract_date_from_folder(base_folder) if base_folder else self._today_mmdd
             
             # Use effect names from the grouped task
             effect_list = grouped_task.get('_effect_names', [])
@@ -1687,7 +2047,7 @@ class UnifiedReportGenerator:
             folder_names = grouped_task.get('_folder_names', [])
             
             # Extract date from first folder (prioritize folder date over current date)
-            d = self._extract_date_from_folder(folder_names[0]) if folder_names else datetime.now().strftime("%m%d")
+            d = self._extract_date_from_folder(folder_names[0]) if folder_names else self._today_mmdd
             
             # Build effect string - combine all unique effects
             effect_str = ', '.join(effect_names) if effect_names else 'Combined'
@@ -1702,6 +2062,11 @@ class UnifiedReportGenerator:
     
     def _scan_directory_once(self, folder: Path, image_exts=None, video_exts=None, metadata_exts=None):
         """Scan directory once and categorize files by type - major performance optimization"""
+        if image_exts is None and video_exts is None and metadata_exts is None:
+            prefetched = self._scan_prefetch.pop(folder, None)
+            if prefetched is not None:
+                return prefetched
+        
         image_exts = image_exts or self.IMAGE_EXTS
         video_exts = video_exts or self.VIDEO_EXTS
         metadata_exts = metadata_exts or self.METADATA_EXTS
@@ -1711,20 +2076,38 @@ class UnifiedReportGenerator:
         if not folder or not folder.exists():
             return images, videos, metadata
         
-        for f in folder.iterdir():
-            if not f.is_file():
-                continue
-            suffix = f.suffix.lower()
-            if suffix in image_exts:
-                images[self.normalize_key(f.stem)] = f
-            elif suffix in video_exts:
-                videos[self.normalize_key(f.stem)] = f
-            elif suffix in metadata_exts:
-                key = f.stem.replace('_metadata', '')
-                metadata[self.normalize_key(key)] = f
+        # scandir reports the entry type from the directory read itself, so
+        # no per-file stat is needed and only media files become Path objects
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                stem, suffix = os.path.splitext(e.name)
+                suffix = suffix.lower()
+                if suffix in image_exts:
+                    images[self.normalize_key(stem)] = Path(e.path)
+                elif suffix in video_exts:
+                    videos[self.normalize_key(stem)] = Path(e.path)
+                elif suffix in metadata_exts:
+                    # Metadata is always written as "<base>_metadata.json"
+                    key = stem[:-9] if stem.endswith('_metadata') else stem
+                    metadata[self.normalize_key(key)] = Path(e.path)
         
         return images, videos, metadata
     
+    def _prefetch_scans(self, folders):
+        """Scan several folders in parallel for later _scan_directory_once calls
+        
+        Listing is I/O bound (slow on network volumes), so threads overlap the
+        readdir latency. Each prefetched result is used once, then dropped.
+        """
+        folders = list(folders)
+        self._scan_prefetch.clear()
+        if not folders:
+            return
+        with ThreadPoolExecutor(max_workers=min(16, len(folders))) as executor:
+            self._scan_prefetch.update(zip(folders, executor.map(self._scan_directory_once, folders)))
+    
     def find_matching_video(self, base_name: str, video_files: dict) -> Optional[Path]:
         """Enhanced video matching for all APIs"""
         if base_name in video_files:
@@ -1737,45 +2120,68 @@ class UnifiedReportGenerator:
         return None
     
     def get_aspect_ratio(self, path, is_video=False):
-        """Calculate aspect ratio with caching - always use actual dimensions"""
+        """Calculate aspect ratio with caching - always use actual dimensions
+        
+        Measured ratios are also kept in the on-disk cache, validated by
+        mtime and size, so regenerating a report skips the PIL/cv2 probe.
+        """
         key = str(path)
         if key in self._ar_cache: 
             return self._ar_cache[key]
         
         # Try to get actual dimensions from the file first
         try:
+            st = os.stat(key)
+            self._present_media.add(key)
+            stamp = [st.st_mtime_ns, st.st_size]
+            cached = self._ar_disk_cache.get(key)
+            if cached and cached[:2] == stamp:
+                if len(cached) > 3:
+                    self._img_formats[key] = cached[3]
+                ar = self._ar_cache[key] = cached[2]
+                return ar
+            
+            ar = None
             if is_video and cv2:
-                cap = cv2.VideoCapture(str(path))
+                # The slide needs the poster frame anyway, and decoding it yields
+                # the dimensions, so one container open serves both
+                if self.extract_first_frame(path) is not None and key in self._ar_cache:
+                    return self._ar_cache[key]
+                cap = _open_capture(path)
                 if cap.isOpened():
                     w, h = cap.get(3), cap.get(4)
                     cap.release()
                     if w > 0 and h > 0:
                         ar = w / h
-                        self._ar_cache[key] = ar
-                        return ar
+                        entry = stamp + [ar]
             else:
                 with Image.open(path) as img:
                     ar = img.width / img.height
-                    self._ar_cache[key] = ar
-                    return ar
+                    # Remembered so ensure_supported_img_format needn't reopen it
+                    self._img_formats[key] = img.format
+                    entry = stamp + [ar, img.format]
+            if ar is not None:
+                self._ar_cache[key] = ar
+                self._ar_disk_cache[key] = entry
+                self._ar_disk_dirty = True
+                return ar
         except:
             pass
         
         # Fallback: Use filename patterns only if we can't read the file
-        import re
         fn = path.name.lower()
-        if re.search(r'(?:^|_|-|\s)9[_-]16(?:$|_|-|\s)', fn) or 'portrait' in fn: 
-            return 9/16
-        if re.search(r'(?:^|_|-|\s)1[_-]1(?:$|_|-|\s)', fn) or 'square' in fn: 
-            return 1
-        if re.search(r'(?:^|_|-|\s)16[_-]9(?:$|_|-|\s)', fn) or 'landscape' in fn: 
-            return 16/9
-        
-        # Final fallback
-        return 16/9
+        ar = next((hint_ar for pattern, word, hint_ar in _AR_HINTS
+                   if word in fn or pattern.search(fn)), 16/9)  # Final fallback
+        self._ar_cache[key] = ar
+        return ar
     
     def extract_first_frame(self, video_path):
-        """Extract first frame with caching"""
+        """Extract first frame as JPEG bytes with caching
+        
+        Encoded frames are also written to a file named by a hash of the
+        video's path, mtime, size and the JPEG quality, so later runs read the JPEG back
+        instead of decoding the video again.
+        """
         if not cv2:
             return None
         
@@ -1784,31 +2190,83 @@ class UnifiedReportGenerator:
             return self._frame_cache[video_key]
         
         try:
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
-                return None
+            st = os.stat(video_key)
+            digest = _frame_digest(f"{video_key}|{st.st_mtime_ns}|{st.st_size}|q{_POSTER_JPEG_QUALITY}")
+            frame_path = _FRAME_CACHE_DIR / digest[:2] / f"{digest}.jpg"
+            try:
+                frame_bytes = frame_path.read_bytes()
+            except OSError:
+                frame_bytes = None
+            if frame_bytes is not None:
+                size = _jpeg_size(frame_bytes)
+                if size:
+                    # The poster has the video's dimensions, so a warm run
+                    # never opens the video for its aspect ratio either
+                    self._record_frame_ar(video_key, st, *size)
+                    self._remember_frame(video_key, frame_bytes)
+                    try:
+                        os.utime(frame_path)  # Mark as recently used for _prune_frame_cache
+                    except OSError:
+                        pass
+                    return frame_bytes
+                # Empty or cut short (e.g. by a crash): drop it and decode again
+                try:
+                    os.unlink(frame_path)
+                except OSError:
+                    pass
             
-            ret, frame = cap.read()
-            cap.release()
+            cap = _open_capture(video_path)
+            try:
+                if not cap.isOpened():
+                    return None
+                ret, frame = cap.read()
+            finally:
+                cap.release()
             
             if not ret or frame is None:
                 return None
             
-            # Create temporary file for the frame
-            temp_dir = tempfile.gettempdir()
-            frame_filename = f"frame_{video_path.stem}_{hash(video_key) % 10000}.jpg"
-            frame_path = Path(temp_dir) / frame_filename
+            # The decoded frame already carries the dimensions, so record the
+            # aspect ratio here and spare get_aspect_ratio a second container open
+            h, w = frame.shape[:2]
+            self._record_frame_ar(video_key, st, w, h)
             
-            # Save frame as JPEG
-            cv2.imwrite(str(frame_path), frame)
+            # Encode to JPEG in memory; python-pptx takes the poster as a stream
+            ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, _POSTER_JPEG_QUALITY])
+            if not ok:
+                return None
             
             # Cache the result
-            self._frame_cache[video_key] = str(frame_path)
-            return str(frame_path)
+            frame_bytes = buf.tobytes()
+            self._remember_frame(video_key, frame_bytes)
+            try:
+                # Written under a private name and renamed into place, so other
+                # processes caching the same frame never see a partial file
+                frame_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = frame_path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+                tmp.write_bytes(frame_bytes)
+                os.replace(tmp, frame_path)
+            except OSError as e:
+                logger.debug("Could not cache frame for %s: %s", video_path, e)
+            return frame_bytes
         except Exception as e:
             logger.warning(f"Failed to extract frame from {video_path}: {e}")
             return None
     
+    def _record_frame_ar(self, video_key, st, width, height):
+        """Cache a video's aspect ratio from its poster frame dimensions"""
+        if width > 0 and height > 0 and video_key not in self._ar_cache:
+            self._ar_cache[video_key] = width / height
+            self._ar_disk_cache[video_key] = [st.st_mtime_ns, st.st_size, width / height]
+            self._ar_disk_dirty = True
+    
+    def _remember_frame(self, video_key, frame_bytes):
+        """Keep a frame in memory, evicting the oldest past _FRAME_CACHE_MAX"""
+        with self._frame_lock:
+            self._frame_cache[video_key] = frame_bytes
+            if len(self._frame_cache) > _FRAME_CACHE_MAX:
+                del self._frame_cache[next(iter(self._frame_cache))]
+    
     def _extract_frames_parallel(self, video_paths):
         """Extract first frames from multiple videos in parallel - major speedup"""
         if not cv2 or not video_paths:
@@ -1858,6 +2316,27 @@ class UnifiedReportGenerator:
         for path_str, ar in results:
             self._ar_cache[path_str] = ar
     
+    def _media_exists(self, path):
+        """Path.exists() that trusts the stat already done by get_aspect_ratio"""
+        return str(path) in self._present_media or Path(path).exists()
+    
+    def prewarm_aspect_ratios(self, media):
+        """Fill the aspect-ratio cache for (path, is_video) items in parallel
+        
+        Probing is dominated by file/container open latency rather than CPU,
+        so a wide thread pool overlaps it. Already cached paths are skipped.
+        """
+        todo = {}
+        for path, is_video in media:
+            if path and str(path) not in self._ar_cache:
+                todo.setdefault(Path(path), is_video)
+        if not todo:
+            return
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(todo))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self.get_aspect_ratio, todo.keys(), todo.values()))
+    
     def _process_in_batches(self, items, process_func, batch_size=None, desc="Processing"):
         """Process items in optimal batches to manage memory usage"""
         if not items:
@@ -1892,34 +2371,38 @@ class UnifiedReportGenerator:
         stem = Path(filename).stem
         
         # First remove the _effect suffix
-        stem = re.sub(r"_effect$", "", stem, flags=re.IGNORECASE)
-        
-        # Create multiple possible effect patterns to match
-        effect_variations = [
-            effect_name.replace(' ', '_'),  # Space to underscore
-            effect_name.replace('-', '_'),  # Dash to underscore
-            effect_name.replace(' ', '_').replace('-', '_'),  # Both replacements
-            effect_name  # Original with spaces/dashes
-        ]
+        stem = _EFFECT_SUFFIX.sub("", stem)
         
-        # Try to remove each variation (case insensitive)
-        for effect_var in effect_variations:
-            # Remove with underscore prefix
-            pattern = f"_{re.escape(effect_var)}"
-            stem = re.sub(pattern, "", stem, flags=re.IGNORECASE)
-            
-            # Remove without underscore prefix
-            pattern = re.escape(effect_var)
-            stem = re.sub(pattern, "", stem, flags=re.IGNORECASE)
+        # Remove each spelling of the effect name (case insensitive)
+        for pattern in self._effect_name_patterns(effect_name):
+            stem = pattern.sub("", stem)
         
         # Clean up any trailing underscores or effect patterns
-        for pattern in [r"_generated", r"_output", r"_result"]:
-            stem = re.sub(pattern, "", stem, flags=re.IGNORECASE)
+        for pattern in _OUTPUT_SUFFIXES:
+            stem = pattern.sub("", stem)
         
         result = self.normalize_key(stem)
         self._extract_key_cache[cache_key] = result
         return result
     
+    def _effect_name_patterns(self, effect_name: str) -> tuple:
+        """Compiled effect-name removal patterns for extract_video_key, built once per effect"""
+        patterns = self._effect_pattern_cache.get(effect_name)
+        if patterns is None:
+            # Create multiple possible effect patterns to match
+            effect_variations = [
+                effect_name.replace(' ', '_'),  # Space to underscore
+                effect_name.replace('-', '_'),  # Dash to underscore
+                effect_name.replace(' ', '_').replace('-', '_'),  # Both replacements
+                effect_name  # Original with spaces/dashes
+            ]
+            # Each variation is removed with, then without, an underscore prefix
+            patterns = self._effect_pattern_cache[effect_name] = tuple(
+                re.compile(pattern, re.IGNORECASE)
+                for effect_var in effect_variations
+                for pattern in (f"_{re.escape(effect_var)}", re.escape(effect_var)))
+        return patterns
+    
     def extract_key_reference(self, filename: str, effect: str) -> str:
         """Extract key for vidu_reference - handles effect name with spaces/dashes/underscores (memoized)"""
         cache_key = f"{filename}|{effect}"
@@ -1957,31 +2440,86 @@ class UnifiedReportGenerator:
         self._extract_key_cache[cache_key] = result
         return result
     
-    def cleanup_temp_frames(self):
-        """Clean up temporary frame files"""
-        for frame_path in self._frame_cache.values():
+    def _load_ar_cache_from_disk(self):
+        """Load the persisted aspect-ratio cache (empty if missing or unreadable)"""
+        try:
+            data = _load_json_file(_AR_CACHE_FILE)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _flush_ar_cache(self):
+        """Write the aspect-ratio cache back to disk if it gained entries"""
+        if not self._ar_disk_dirty:
+            return
+        try:
+            # Report workers flush concurrently: merge what they saved meanwhile
+            # so the last writer doesn't drop their entries (stale stamps just re-probe)
+            cache = {**self._load_ar_cache_from_disk(), **self._ar_disk_cache}
+            # New entries were added last, so trimming from the front drops the oldest
+            excess = len(cache) - _AR_CACHE_MAX
+            if excess > 0:
+                for key in list(cache)[:excess]:
+                    del cache[key]
+            self._ar_disk_cache = cache
+            _AR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _AR_CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps(self._ar_disk_cache), encoding='utf-8')
+            os.replace(tmp, _AR_CACHE_FILE)
+            self._ar_disk_dirty = False
+        except OSError as e:
+            logger.debug(f"Could not save aspect-ratio cache: {e}")
+    
+    def _prune_frame_cache(self):
+        """Trim the on-disk frame cache to _FRAME_CACHE_DISK_MAX, least recently used first"""
+        frames = []
+        try:
+            with os.scandir(_FRAME_CACHE_DIR) as buckets:
+                for bucket in buckets:
+                    if bucket.is_dir(follow_symlinks=False):
+                        with os.scandir(bucket.path) as it:
+                            for entry in it:
+                                st = entry.stat(follow_symlinks=False)
+                                frames.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in frames)
+        if total <= _FRAME_CACHE_DISK_MAX:
+            return
+        frames.sort()
+        for _, size, path in frames:
+            if total <= _FRAME_CACHE_DISK_MAX:
+                break
             try:
-                if Path(frame_path).exists():
-                    os.unlink(frame_path)
-            except Exception:
+                os.unlink(path)
+            except OSError:
                 pass
+            total -= size
+    
+    def cleanup_temp_frames(self):
+        """Release cached poster frames"""
         self._frame_cache.clear()
     
+    def _temp_dir(self):
+        """Directory holding this run's format conversions (thread-safe, created lazily)"""
+        with self._tempdir_lock:
+            if self._tempdir is None:
+                self._tempdir = tempfile.mkdtemp(prefix='gai_report_')
+            return self._tempdir
+    
     def cleanup_tempfiles(self):
         """Clean up temporary files from image format conversions"""
-        for f in self._tempfiles_to_cleanup:
-            try:
-                if Path(f).exists():
-                    os.unlink(f)
-            except Exception:
-                pass
-        self._tempfiles_to_cleanup.clear()
+        # All conversions share one directory, so one rmtree replaces per-file unlinks
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+        self._img_format_cache.clear()  # Entries may point at the removed files
     
     def cleanup_caches(self):
         """Clear all memory caches - useful between large batches"""
         self._normalize_cache.clear()
         self._extract_key_cache.clear()
-        logger.debug(f"Cleared string caches: {len(self._normalize_cache)} + {len(self._extract_key_cache)} entries")
+        logger.debug("Cleared string caches: %d + %d entries", len(self._normalize_cache), len(self._extract_key_cache))
     
     def configure_performance(self, batch_size=None, max_workers=None, show_progress=None):
         """Configure performance settings for optimization"""
@@ -2017,7 +2555,7 @@ class UnifiedReportGenerator:
                         'templates/I2V Comparison Template.pptx' if use_comparison else 'templates/I2V templates.pptx'))
         
         try:
-            ppt = Presentation(template_path) if Path(template_path).exists() else Presentation()
+            ppt = Presentation(io.BytesIO(self._template_bytes(template_path))) if Path(template_path).exists() else Presentation()
             template_loaded = Path(template_path).exists()
             logger.info(f"✓ Template loaded: {template_path}")
         except Exception as e:
@@ -2027,9 +2565,18 @@ class UnifiedReportGenerator:
         
         # Set slide dimensions
         ppt.slide_width, ppt.slide_height = Cm(33.87), Cm(19.05)
+        _index_package_parts(ppt)
         
         return ppt, template_loaded, use_comparison
     
+    def _template_bytes(self, template_path) -> bytes:
+        """Read a template once per run; every presentation built from it reuses the bytes"""
+        key = (str(template_path), os.stat(template_path).st_mtime_ns)
+        data = self._template_cache.get(key)
+        if data is None:
+            data = self._template_cache[key] = Path(template_path).read_bytes()
+        return data
+    
     def create_presentation(self, pairs: List[MediaPair], task: Dict) -> bool:
         """Create presentation using unified system"""
         if not pairs:
@@ -2190,7 +2737,7 @@ class UnifiedReportGenerator:
                         folder_name = folder.name if hasattr(folder, 'name') else str(folder)
                     
                     # Remove date prefix (e.g., "1017 ") from folder name
-                    folder_name = re.sub(r'^\d{4}\s+', '', folder_name)
+                    folder_name = _DATE_PREFIX_STRIP.sub('', folder_name)
                     
                     # Get source link for this specific task
                     task_source_link = individual_task.get('source_video_link', '')
@@ -2264,8 +2811,24 @@ class UnifiedReportGenerator:
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = output_dir / f"{filename}.pptx"
-            # Save
-            ppt.save(str(output_path))
+            # Save: serialize in memory, then hand the whole buffer to the OS
+            buf = io.BytesIO()
+            compression = self.config.get('output', {}).get('compression') or self.config.get('compression', 'deflate')
+            if compression in ('stored', 'media'):
+                package = ppt.part.package
+                writer = _StoredPackageWriter if compression == 'stored' else _MediaStoredPackageWriter
+                writer.write(buf, package._rels, tuple(package.iter_parts()))
+            else:
+                ppt.save(buf)
+            data = buf.getbuffer()
+            fd = os.open(str(output_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = 0
+                while written < len(data):
+                    written += os.write(fd, data[written:])
+            finally:
+                os.close(fd)
+                data.release()
             logger.info(f"✓ Saved: {output_path}")
             return True
         except Exception as e:
@@ -2324,19 +2887,17 @@ class UnifiedReportGenerator:
                     return self._run_grouped(tasks, group_tasks_by)
                 else:
                     # Original individual presentation mode
-                    successful = 0
-                    for i, task in enumerate(tasks, 1):
-                        pairs = self.process_batch(task)
-                        if pairs:
-                            if self.create_presentation(pairs, task):
-                                successful += 1
+                    successful = sum(self._map_reports(_build_task_report, self._build_task,
+                                                       [(task,) for task in tasks]))
                     logger.info(f"✓ Generated {successful}/{len(tasks)} presentations")
                     return successful > 0
         except Exception as e:
             logger.error(f"✗ Report generation failed: {e}")
             return False
         finally:
-            # Cleanup all temporary files
+            # Persist probe results, then cleanup all temporary files
+            self._flush_ar_cache()
+            self._prune_frame_cache()  # After any report workers have finished writing frames
             self.cleanup_temp_frames()
             self.cleanup_tempfiles()  # Cleanup temporary format conversions
     
@@ -2362,68 +2923,62 @@ class UnifiedReportGenerator:
             else:
                 regular_tasks.append(task)
         
-        successful_groups = 0
-        total_groups = 0
-        
-        # Process regular tasks (non-comparison template)
-        if regular_tasks:
-            logger.info(f"📄 Processing {len(regular_tasks)} regular template tasks")
-            regular_group_count = (len(regular_tasks) + group_size - 1) // group_size
-            total_groups += regular_group_count
-            
-            for group_idx in range(0, len(regular_tasks), group_size):
-                group_tasks = regular_tasks[group_idx:group_idx + group_size]
-                group_num = (group_idx // group_size) + 1
-                
-                logger.info(f"\n📊 Processing regular group {group_num}/{regular_group_count} ({len(group_tasks)} tasks)")
-                
-                task_pairs_list = []
-                group_task_info = []
-                
-                for task in group_tasks:
-                    pairs = self.process_batch(task)
-                    if pairs:
-                        task_pairs_list.append({'task': task, 'pairs': pairs})
-                        group_task_info.append(task)
-                
-                if task_pairs_list:
-                    combined_task = self._create_combined_task(group_task_info, group_num, regular_group_count)
-                    if self.create_grouped_presentation(task_pairs_list, combined_task):
-                        successful_groups += 1
-                else:
-                    logger.warning(f"⚠ Regular group {group_num} has no valid pairs")
+        # Each group becomes one combined presentation; collect them all first
+        groups = []
+        for label, label_tasks in (('regular', regular_tasks), ('comparison', comparison_tasks)):
+            if not label_tasks:
+                continue
+            logger.info(f"📄 Processing {len(label_tasks)} {label} template tasks")
+            group_count = (len(label_tasks) + group_size - 1) // group_size
+            for group_idx in range(0, len(label_tasks), group_size):
+                groups.append((label, label_tasks[group_idx:group_idx + group_size],
+                               (group_idx // group_size) + 1, group_count))
         
-        # Process comparison tasks (comparison template)
-        if comparison_tasks:
-            logger.info(f"📄 Processing {len(comparison_tasks)} comparison template tasks")
-            comparison_group_count = (len(comparison_tasks) + group_size - 1) // group_size
-            total_groups += comparison_group_count
-            
-            for group_idx in range(0, len(comparison_tasks), group_size):
-                group_tasks = comparison_tasks[group_idx:group_idx + group_size]
-                group_num = (group_idx // group_size) + 1
-                
-                logger.info(f"\n📊 Processing comparison group {group_num}/{comparison_group_count} ({len(group_tasks)} tasks)")
-                
-                task_pairs_list = []
-                group_task_info = []
-                
-                for task in group_tasks:
-                    pairs = self.process_batch(task)
-                    if pairs:
-                        task_pairs_list.append({'task': task, 'pairs': pairs})
-                        group_task_info.append(task)
-                
-                if task_pairs_list:
-                    combined_task = self._create_combined_task(group_task_info, group_num, comparison_group_count)
-                    if self.create_grouped_presentation(task_pairs_list, combined_task):
-                        successful_groups += 1
-                else:
-                    logger.warning(f"⚠ Comparison group {group_num} has no valid pairs")
+        successful_groups = sum(self._map_reports(_build_group_report, self._build_group, groups))
         
-        logger.info(f"\n✓ Generated {successful_groups}/{total_groups} grouped presentations")
+        logger.info(f"\n✓ Generated {successful_groups}/{len(groups)} grouped presentations")
         return successful_groups > 0
     
+    def _build_group(self, label, group_tasks, group_num, group_count) -> bool:
+        """Collect a group's pairs and build its combined presentation"""
+        logger.info(f"\n📊 Processing {label} group {group_num}/{group_count} ({len(group_tasks)} tasks)")
+        
+        task_pairs_list = []
+        group_task_info = []
+        
+        for task in group_tasks:
+            pairs = self.process_batch(task)
+            if pairs:
+                task_pairs_list.append({'task': task, 'pairs': pairs})
+                group_task_info.append(task)
+        
+        if not task_pairs_list:
+            logger.warning(f"⚠ {label.title()} group {group_num} has no valid pairs")
+            return False
+        combined_task = self._create_combined_task(group_task_info, group_num, group_count)
+        return self.create_grouped_presentation(task_pairs_list, combined_task)
+    
+    def _build_task(self, task) -> bool:
+        """Collect one task's pairs and build its presentation"""
+        pairs = self.process_batch(task)
+        return bool(pairs) and self.create_presentation(pairs, task)
+    
+    def _map_reports(self, worker, method, jobs) -> List[bool]:
+        """Run independent report jobs serially, or in report_workers processes
+        
+        Each deck is CPU-bound python-pptx/lxml work writing its own file, so
+        with report_workers > 1 the jobs go to a process pool (spawn: safe when
+        run() is called from a thread). worker is the module-level equivalent
+        of method that builds a fresh generator in the child.
+        """
+        workers = min(int(self.config.get('output', {}).get('report_workers')
+                          or self.config.get('report_workers', 1)), len(jobs))
+        if workers <= 1:
+            return [method(*job) for job in jobs]
+        logger.info(f"⚡ Building {len(jobs)} reports in {workers} processes")
+        with multiprocessing.get_context('spawn').Pool(workers, maxtasksperchild=4) as pool:
+            return pool.starmap(worker, [(self.api_name, self.config_file, *job) for job in jobs])
+    
     def _create_combined_task(self, tasks: List[Dict], group_num: int, total_groups: int) -> Dict:
         """Create a combined task dict for grouped presentation
         
@@ -2480,6 +3035,30 @@ class UnifiedReportGenerator:
         
         return combined
 
+def _run_in_worker(api_name, config_file, build, *args):
+    """Build one report in a worker process with a fresh generator (report_workers > 1)"""
+    generator = UnifiedReportGenerator(api_name, config_file)
+    try:
+        return build(generator, *args)
+    except Exception as e:
+        logger.error(f"✗ Report generation failed: {e}")
+        return False
+    finally:
+        generator._flush_ar_cache()
+        generator.cleanup_temp_frames()
+        generator.cleanup_tempfiles()
+
+
+def _build_task_report(api_name, config_file, task):
+    """Worker entry point: one task's presentation"""
+    return _run_in_worker(api_name, config_file, UnifiedReportGenerator._build_task, task)
+
+
+def _build_group_report(api_name, config_file, *group):
+    """Worker entry point: one combined presentation for a group of tasks"""
+    return _run_in_worker(api_name, config_file, UnifiedReportGenerator._build_group, *group)
+
+
 def create_report_generator(api_name, config_file=None):
     """Factory function to create report generator"""
     supported_apis = ['kling', 'kling_effects', 'kling_endframe', 'kling_ttv', 'nano_banana', 'vidu_effects', 'vidu_reference', 'runway', 'genvideo', 'pixverse', 'wan', 'veo']
@@ -107,16 +107,13 @@ class BaseAPIHandler:
         base_name = Path(file_path).stem
         metadata_file = Path(metadata_folder) / f"{base_name}_metadata.json"
         
-        if metadata_file.exists():
-            try:
-                import json
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                # Only skip if previous processing was successful
-                return metadata.get('success', False)
-            except (json.JSONDecodeError, IOError):
-                return False
-        return False
+        # A missing file raises OSError, so no separate exists() stat
+        try:
+            metadata = self.processor._read_json(metadata_file)
+            # Only skip if previous processing was successful
+            return metadata.get('success', False)
+        except (ValueError, OSError):
+            return False
     
     def process_task(self, task, task_num, total_tasks):
         """Process entire task - common structure for most APIs."""
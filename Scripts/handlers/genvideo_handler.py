@@ -40,13 +40,13 @@ class GenvideoHandler(BaseAPIHandler):
             source_path = Path(result)
             if not source_path.exists():
                 raise ValueError(f"Generated image path does not exist: {source_path}")
-            shutil.copy2(source_path, output_path)
+            shutil.copyfile(source_path, output_path)
         elif isinstance(result, dict):
             if 'path' in result and result['path']:
                 source_path = Path(result['path'])
                 if not source_path.exists():
                     raise ValueError(f"Generated image path does not exist: {source_path}")
-                shutil.copy2(source_path, output_path)
+                shutil.copyfile(source_path, output_path)
             elif 'url' in result and result['url']:
                 if not self.processor.download_file(result['url'], output_path):
                     raise IOError("Image download failed")
@@ -309,7 +309,7 @@ class KlingEndframeHandler(BaseAPIHandler):
         if not video_saved and video_dict and 'video' in video_dict:
             local_path = Path(video_dict['video'])
             if local_path.exists():
-                shutil.copy2(local_path, output_path)
+                shutil.copyfile(local_path, output_path)
                 video_saved = True
         
         # Save metadata
@@ -88,7 +88,7 @@ class KlingTTVHandler(BaseAPIHandler):
         if not video_saved and output_video and isinstance(output_video, dict) and 'video' in output_video:
             local_path = Path(output_video['video'])
             if local_path.exists():
-                shutil.copy2(local_path, output_path)
+                shutil.copyfile(local_path, output_path)
                 video_saved = True
                 self.logger.info(f" ✅ Copied from local: {output_path.name}")
             else:
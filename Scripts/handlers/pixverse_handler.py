@@ -7,6 +7,8 @@ import re
 from datetime import datetime
 from .base_handler import BaseAPIHandler
 
+_VIDEO_ID = re.compile(r'VideoID:\s*(\d+)')
+
 
 class PixverseHandler(BaseAPIHandler):
     """Pixverse effects handler."""
@@ -44,7 +46,7 @@ class PixverseHandler(BaseAPIHandler):
         # Extract VideoID
         video_id = None
         if error_message and "VideoID:" in error_message:
-            match = re.search(r'VideoID:\s*(\d+)', error_message)
+            match = _VIDEO_ID.search(error_message)
             if match:
                 video_id = match.group(1)
         
@@ -68,7 +70,7 @@ class PixverseHandler(BaseAPIHandler):
         if not video_saved and output_video and isinstance(output_video, dict) and "video" in output_video:
             local_path = Path(output_video["video"])
             if local_path.exists():
-                shutil.copy2(local_path, output_path)
+                shutil.copyfile(local_path, output_path)
                 video_saved = True
         
         if not video_saved:
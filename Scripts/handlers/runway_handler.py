@@ -1,16 +1,40 @@
 """Runway API Handler - Only unique logic."""
 from pathlib import Path
 from gradio_client import handle_file
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import product
 from .base_handler import BaseAPIHandler
 
 
+class _RateLimiter:
+    """Spaces out calls so consecutive starts are at least ``interval`` seconds apart."""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class RunwayHandler(BaseAPIHandler):
     """Runway video processing handler."""
     
     def process_task(self, task, task_num, total_tasks):
-        """Override: Handle video-reference pairing strategies."""
+        """Override: Handle video-reference pairing strategies.
+        
+        Jobs are pipelined: up to ``max_concurrent`` generations are in flight
+        at once, with submissions spaced ``rate_limit`` seconds apart.
+        """
         folder = Path(task['folder'])
         self.logger.info(f"Task {task_num}/{total_tasks}: {folder.name}")
         
@@ -21,59 +45,72 @@ class RunwayHandler(BaseAPIHandler):
         video_files = self.processor._get_files_by_type(source_folder, 'video')
         requires_reference = task.get('requires_reference', False)
         
-        successful = 0
+        # Lazily pair videos with references (None = text-to-video)
+        video_strs = {v: str(v) for v in video_files}
+        ref_strs = {}
         if requires_reference:
             reference_images = task.get('reference_images', [])
             pairing_strategy = task.get('pairing_strategy', 'one_to_one')
+            ref_strs = {r: str(r) for r in reference_images}
             
             if pairing_strategy == "all_combinations":
+                pairs = product(video_files, reference_images)
                 total = len(video_files) * len(reference_images)
-                for i, (video_file, ref_image) in enumerate(
-                    [(v, r) for v in video_files for r in reference_images], 1):
-                    
-                    self.logger.info(f"{i}/{total}: {video_file.name} + {ref_image.name}")
-                    task_config = task.copy()
-                    task_config['reference_image'] = str(ref_image)
-                    
-                    if self.processor.process_file(str(video_file), task_config, output_folder, metadata_folder):
-                        successful += 1
-                    
-                    if i < total:
-                        time.sleep(self.api_defs.get('rate_limit', 3))
             else:  # one_to_one
-                pairs = list(zip(video_files, reference_images))
-                for i, (video_file, ref_image) in enumerate(pairs, 1):
-                    self.logger.info(f"{i}/{len(pairs)}: {video_file.name} + {ref_image.name}")
-                    task_config = task.copy()
-                    task_config['reference_image'] = str(ref_image)
-                    
-                    if self.processor.process_file(str(video_file), task_config, output_folder, metadata_folder):
-                        successful += 1
-                    
-                    if i < len(pairs):
-                        time.sleep(self.api_defs.get('rate_limit', 3))
+                pairs = zip(video_files, reference_images)
+                total = min(len(video_files), len(reference_images))
         else:
             # Text-to-video without reference
-            for i, video_file in enumerate(video_files, 1):
-                self.logger.info(f"{i}/{len(video_files)}: {video_file.name} (text-to-video)")
-                
-                if self.processor.process_file(str(video_file), task, output_folder, metadata_folder):
-                    successful += 1
-                
-                if i < len(video_files):
-                    time.sleep(self.api_defs.get('rate_limit', 3))
+            pairs = ((v, None) for v in video_files)
+            total = len(video_files)
+        
+        if total:
+            limiter = _RateLimiter(self.api_defs.get('rate_limit', 3))
+            
+            def run_job(numbered_pair):
+                i, (video_file, ref_image) = numbered_pair
+                if ref_image is None:
+                    label, task_config = f"{video_file.name} (text-to-video)", task
+                else:
+                    label = f"{video_file.name} + {ref_image.name}"
+                    task_config = task.copy()
+                    task_config['reference_image'] = ref_strs[ref_image]
+                limiter.wait()
+                self.logger.info(f"{i}/{total}: {label}")
+                self.processor.process_file(video_strs[video_file], task_config, output_folder, metadata_folder)
+            
+            # Submit through a window of max_workers futures, refilled as jobs
+            # finish, so the pairs are generated as they're consumed rather than
+            # all queued up front (Executor.map would drain the iterator at once)
+            max_workers = min(self.api_defs.get('max_concurrent', 4), total)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = set()
+                for numbered_pair in enumerate(pairs, 1):
+                    if len(in_flight) >= max_workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    in_flight.add(executor.submit(run_job, numbered_pair))
+                for future in in_flight:
+                    future.result()
         
+        # Successful generations are the ones whose download completed
+        successful = sum(self.processor.wait_for_downloads())
         self.logger.info(f"Task {task_num}: {successful} successful")
     
     def _make_api_call(self, file_path, task_config, attempt):
-        """Make Runway API call."""
+        """Make Runway API call.
+        
+        Returns (video_info, prediction): the source is probed once per attempt
+        and the probe is handed to _handle_result along with the result.
+        """
         video_info = self.processor._get_video_info(file_path)
         optimal_ratio = self.processor.get_optimal_runway_ratio(
             video_info['width'], video_info['height']) if video_info else '1280:720'
         
         reference_image_path = task_config.get('reference_image')
         
-        return self.client.predict(
+        return video_info, self.client.predict(
             video_path={"video": handle_file(str(file_path))},
             prompt=task_config['prompt'],
             model=self.config.get('model', 'gen4_aleph'),
@@ -85,7 +122,8 @@ class RunwayHandler(BaseAPIHandler):
     
     def _handle_result(self, result, file_path, task_config, output_folder, 
                       metadata_folder, base_name, file_name, start_time, attempt):
-        """Handle Runway API result."""
+        """Handle Runway API result (the (video_info, prediction) pair from _make_api_call)."""
+        video_info, result = result
         output_url = result[0] if len(result) > 0 else None
         
         if not output_url:
@@ -93,22 +131,45 @@ class RunwayHandler(BaseAPIHandler):
         
         # Generate output filename
         reference_image_path = task_config.get('reference_image')
-        if reference_image_path:
-            ref_stem = Path(reference_image_path).stem
-            output_filename = f"{base_name}_ref_{ref_stem}_runway_generated.mp4"
+        ref_path = Path(reference_image_path) if reference_image_path else None
+        if ref_path:
+            output_filename = f"{base_name}_ref_{ref_path.stem}_runway_generated.mp4"
         else:
             output_filename = f"{base_name}_text_runway_generated.mp4"
         
         output_path = Path(output_folder) / output_filename
-        video_saved = self.processor.download_file(output_url, output_path)
+        
+        # Download + metadata run in the background so the next submission
+        # overlaps this transfer; process_task collects the outcome
+        self.processor.submit_download(
+            self._finish_download, output_url, output_path, output_filename, video_info,
+            ref_path, task_config, metadata_folder, base_name, file_name, start_time, attempt)
+        return True
+    
+    def _finish_download(self, output_url, output_path, output_filename, video_info, ref_path,
+                         task_config, metadata_folder, base_name, file_name, start_time, attempt):
+        """Download a generated video and write its metadata (runs on the download pool).
+        
+        The generation call has already returned by the time this runs, so a
+        failed download is retried here, with the same attempts and pause as
+        process_file, instead of going back through the retry loop.
+        """
+        ref_name = ref_path.name if ref_path else None
+        max_retries = self.api_defs.get('max_retries', 3)
+        for download_attempt in range(max_retries):
+            if download_attempt > 0:
+                self.logger.info(f" 🔄 Download retry {download_attempt}/{max_retries-1}: {output_filename}")
+                time.sleep(5)
+            video_saved = self.processor.download_file(output_url, output_path)
+            if video_saved:
+                break
         
         # Save metadata
         processing_time = time.time() - start_time
-        video_info = self.processor._get_video_info(file_path)
         
         metadata = {
             'source_dimensions': f"{video_info['width']}x{video_info['height']}" if video_info else "unknown",
-            'reference_image': Path(reference_image_path).name if reference_image_path else None,
+            'reference_image': ref_name,
             'prompt': task_config['prompt'],
             'output_url': output_url,
             'generated_video': output_filename,
@@ -117,14 +178,12 @@ class RunwayHandler(BaseAPIHandler):
             'attempts': attempt + 1,
             'success': video_saved,
             'api_name': self.api_name,
-            'generation_type': 'image_to_video' if reference_image_path else 'text_to_video'
+            'generation_type': 'image_to_video' if ref_path else 'text_to_video'
         }
         
-        ref_stem = Path(reference_image_path).stem if reference_image_path else ''
         self.processor.save_runway_metadata(
-            Path(metadata_folder), base_name, ref_stem, file_name,
-            Path(reference_image_path).name if reference_image_path else None,
-            metadata, task_config)
+            Path(metadata_folder), base_name, ref_path.stem if ref_path else '', file_name,
+            ref_name, metadata, task_config)
         
         if video_saved:
             self.logger.info(f"Generated {output_filename}")
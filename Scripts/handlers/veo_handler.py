@@ -81,7 +81,7 @@ class VeoHandler(BaseAPIHandler):
         if video_dict and isinstance(video_dict, dict) and 'video' in video_dict:
             local_path = Path(video_dict['video'])
             if local_path.exists():
-                shutil.copy2(local_path, output_path)
+                shutil.copyfile(local_path, output_path)
                 video_saved = True
                 self.logger.info(f" ✅ Generated: {output_path.name}")
             else:
@@ -186,7 +186,7 @@ class WanHandler(BaseAPIHandler):
         if video_source.exists():
             # Local file - copy directly
             import shutil
-            shutil.copy2(video_source, output_path)
+            shutil.copyfile(video_source, output_path)
             self.logger.info(f" 📥 Copied local file: {video_source}")
         else:
             # Remote URL - download
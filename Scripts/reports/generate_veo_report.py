@@ -13,6 +13,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 from pptx import Presentation
@@ -20,6 +21,11 @@ from pptx.dml.color import RGBColor
 from pptx.util import Cm, Pt
 from pptx.enum.text import PP_ALIGN
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -27,6 +33,16 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _load_json_file(path):
+    """Parse a JSON file from raw bytes, using orjson when it is installed"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+# Placeholder types that can hold media (picture, object, chart, table, ...)
+_MEDIA_PH_TYPES = frozenset({6, 7, 8, 13, 18, 19})
+
+
 @dataclass
 class VeoMediaPair:
     """
@@ -88,6 +104,7 @@ class VeoReportGenerator:
         else:
             self.config_file = config_file
         self.config = {}
+        self._ar_cache = {}  # video path -> aspect ratio, filled from decoded poster frames
         
         self.load_config()
     
@@ -95,20 +112,24 @@ class VeoReportGenerator:
         """Load Veo configuration from YAML or JSON."""
         config_path = Path(self.config_file)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                # Detect format by extension
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
+            # Detect format by extension
+            if config_path.suffix.lower() in ['.yaml', '.yml']:
+                with open(config_path, 'r', encoding='utf-8') as f:
                     self.config = yaml.safe_load(f)
-                    logger.info(f"✓ Config loaded: {self.config_file} (YAML)")
-                else:
-                    self.config = json.load(f)
-                    logger.info(f"✓ Config loaded: {self.config_file} (JSON)")
+                logger.info(f"✓ Config loaded: {self.config_file} (YAML)")
+            else:
+                self.config = _load_json_file(config_path)
+                logger.info(f"✓ Config loaded: {self.config_file} (JSON)")
         except Exception as e:
             logger.error(f"❌ Config error: {e}")
             sys.exit(1)
     
     def get_aspect_ratio(self, media_path: Path) -> float:
         """Get aspect ratio of video file."""
+        key = str(media_path)
+        if key in self._ar_cache:
+            return self._ar_cache[key]
+        
         try:
             import cv2
             cap = cv2.VideoCapture(str(media_path))
@@ -117,7 +138,8 @@ class VeoReportGenerator:
                 height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
                 cap.release()
                 if height > 0:
-                    return width / height
+                    ar = self._ar_cache[key] = width / height
+                    return ar
         except Exception as e:
             logger.warning(f"Failed to get aspect ratio for {media_path.name}: {e}")
         return 1.0  # Default to square
@@ -136,6 +158,12 @@ class VeoReportGenerator:
             cap.release()
             
             if ret:
+                # The frame carries the dimensions, so get_aspect_ratio needn't
+                # open the video a second time
+                h, w = frame.shape[:2]
+                if h > 0:
+                    self._ar_cache[str(video_path)] = w / h
+                
                 tmp = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
                 cv2.imwrite(tmp.name, frame)
                 tmp.close()
@@ -202,8 +230,7 @@ class VeoReportGenerator:
                 metadata = {}
                 if metadata_path.exists():
                     try:
-                        with open(metadata_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
+                        metadata = _load_json_file(metadata_path)
                     except Exception as e:
                         logger.warning(f"Failed to load metadata {metadata_path.name}: {e}")
                 
@@ -319,17 +346,24 @@ class VeoReportGenerator:
     
     def _handle_template_slide(self, slide, pair: VeoMediaPair, index: int):
         """Handle slide with template placeholders."""
+        # Single pass over the placeholders: first title plus the media slots
+        title_ph, phs = None, []
+        for p in slide.placeholders:
+            ph_type = p.placeholder_format.type
+            if ph_type == 1:
+                if title_ph is None:
+                    title_ph = p
+            elif ph_type in _MEDIA_PH_TYPES:
+                phs.append(p)
+        
         # Update title if present
-        title_ph = next((p for p in slide.placeholders if p.placeholder_format.type == 1), None)
         if title_ph:
             title_ph.text = f"Generation {index}: {pair.display_name}"
             if pair.failed and title_ph.text_frame.paragraphs:
                 title_ph.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 0, 0)
         
-        # Get media placeholders (sorted left to right)
-        phs = sorted([p for p in slide.placeholders 
-                     if p.placeholder_format.type in {6, 7, 8, 13, 18, 19}],
-                    key=lambda x: getattr(x, 'left', 0))
+        # Media placeholders, left to right
+        phs.sort(key=attrgetter('left'))
         
         if len(phs) >= 2:
             # Left placeholder: Prompt text
@@ -419,13 +453,14 @@ class VeoReportGenerator:
         if pair.generated_video_path and pair.generated_video_path.exists():
             # Add video with aspect ratio calculation
             try:
+                # Extract first frame for poster (also records the aspect ratio)
+                first_frame_path = self.extract_first_frame(pair.generated_video_path)
+                
                 # Calculate aspect ratio and positioning
                 ar = self.get_aspect_ratio(pair.generated_video_path)
                 sw, sh = (w, w/ar) if ar > w/h else (h*ar, h)
                 fl, ft = l + (w - sw)/2, t + (h - sh)/2
                 
-                # Extract first frame for poster
-                first_frame_path = self.extract_first_frame(pair.generated_video_path)
                 if first_frame_path:
                     slide.shapes.add_movie(str(pair.generated_video_path), fl, ft, sw, sh,
                                          poster_frame_image=first_frame_path)
@@ -1,18 +1,35 @@
 from PIL import Image
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+def _resize_one(image_file, output_path, max_size):
+    """Resize a single image; runs in a worker process."""
+    try:
+        with Image.open(image_file) as img:
+            original_size = img.size
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            new_size = img.size
+            
+            output_file = output_path / image_file.name
+            img.save(output_file, quality=95, optimize=True)
+            return f"Resized: {image_file.name} from {original_size} to {new_size}"
+    except Exception as e:
+        return f"Error processing {image_file.name}: {e}"
+
 def resize_images(input_folder, output_folder=None, max_size=4000):
     input_path = Path(input_folder)
     output_path = Path(output_folder) if output_folder else input_path / "resized"
     output_path.mkdir(exist_ok=True)
     
-    # Fixed: separate glob patterns for each extension
-    extensions = ['*.jpg', '*.jpeg', '*.png', '*.tiff', '*.bmp', '*.JPG', '*.JPEG', '*.PNG']
+    # One directory pass, matching extensions case-insensitively (separate
+    # '*.jpg'/'*.JPG' globs list each file twice on macOS)
+    extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.bmp'}
     
-    image_files = []
-    for ext in extensions:
-        image_files.extend(input_path.glob(ext))
+    with os.scandir(input_path) as it:
+        image_files = [Path(e.path) for e in it
+                       if e.is_file() and os.path.splitext(e.name)[1].lower() in extensions]
     
     if not image_files:
         print(f"No image files found in {input_path}")
@@ -21,18 +38,12 @@ def resize_images(input_folder, output_folder=None, max_size=4000):
             print(f"  {file.name}")
         return
     
-    for image_file in image_files:
-        try:
-            with Image.open(image_file) as img:
-                original_size = img.size
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                new_size = img.size
-                
-                output_file = output_path / image_file.name
-                img.save(output_file, quality=95, optimize=True)
-                print(f"Resized: {image_file.name} from {original_size} to {new_size}")
-        except Exception as e:
-            print(f"Error processing {image_file.name}: {e}")
+    # LANCZOS + JPEG encode is CPU-bound, so spread the files across cores
+    resize = partial(_resize_one, output_path=output_path, max_size=max_size)
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(resize, image_files, chunksize=4):
+            print(message)
 
 # Usage
-resize_images("/Users/ethanhsu/Desktop/GAI/Pixverse/0922 4 Styles/Skull Multiverse/Source")
\ No newline at end of file
+if __name__ == "__main__":
+    resize_images("/Users/ethanhsu/Desktop/GAI/Pixverse/0922 4 Styles/Skull Multiverse/Source")
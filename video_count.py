@@ -1,13 +1,23 @@
 import os
 
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv', '.webm'})
+
 def count_videos_in_directory(directory='.'):
-    video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv', '.webm'}
     video_count = 0
+    stack = [directory]
 
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if os.path.splitext(file)[1].lower() in video_extensions:
-                video_count += 1
+    # Iterative scandir walk: entry types come from the directory read, and
+    # no per-directory file lists are built (os.walk skips unreadable dirs too)
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                        video_count += 1
+        except OSError:
+            continue
 
     return video_count
 